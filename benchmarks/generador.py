@@ -0,0 +1,135 @@
+import argparse
+import os
+import pickle
+import random
+from modelo.rutina import Rutina
+from modelo.ejercicio_fuerza import EjercicioFuerza, EjercicioFuerzaDropSet
+from modelo.ejercicio_cardio import EjercicioCardio, EjercicioCardioHIIT
+
+MEZCLA_POR_DEFECTO = {
+    "EjercicioFuerza": 0.45,
+    "EjercicioFuerzaDropSet": 0.15,
+    "EjercicioCardio": 0.25,
+    "EjercicioCardioHIIT": 0.15,
+}
+
+NOMBRES_FUERZA = [
+    "Press banca", "Sentadilla", "Peso muerto", "Press militar", "Remo con barra",
+    "Dominadas", "Curl de bíceps", "Extensión de tríceps", "Prensa", "Zancadas",
+]
+NOMBRES_CARDIO = ["Cinta", "Bicicleta", "Elíptica", "Remo", "Escaladora"]
+NOMBRES_RUTINA = ["Pecho", "Espalda", "Piernas", "Hombros", "Brazos", "Full body", "Cardio", "Core"]
+
+
+def leer_mezcla(texto):
+    """
+    Interpreta una mezcla de tipos de ejercicio escrita como "Tipo=peso,Tipo=peso".
+    Args:
+        texto (str): Mezcla en formato texto.
+    Returns:
+        dict: Peso relativo por nombre de clase.
+    """
+    mezcla = {}
+    for parte in texto.split(","):
+        nombre, _, peso = parte.partition("=")
+        nombre = nombre.strip()
+        if nombre not in MEZCLA_POR_DEFECTO:
+            raise ValueError(f"Tipo de ejercicio desconocido: {nombre}")
+        mezcla[nombre] = float(peso)
+    return mezcla
+
+
+class GeneradorRutinas:
+    """
+    Genera bibliotecas de rutinas sintéticas y reproducibles.
+    Con la misma semilla y la misma mezcla produce siempre las mismas rutinas.
+    Atributos:
+        semilla (int): Semilla del generador aleatorio.
+        mezcla (dict): Peso relativo de cada tipo de ejercicio.
+        ejercicios_por_rutina (tuple): Cantidad mínima y máxima de ejercicios por rutina.
+    """
+
+    def __init__(self, semilla=0, mezcla=None, ejercicios_por_rutina=(3, 8)):
+        """
+        Args:
+            semilla (int): Semilla del generador aleatorio.
+            mezcla (dict o None): Peso relativo de cada tipo de ejercicio.
+            ejercicios_por_rutina (tuple): Cantidad mínima y máxima de ejercicios por rutina.
+        """
+        self.semilla = semilla
+        self.mezcla = dict(mezcla or MEZCLA_POR_DEFECTO)
+        self.ejercicios_por_rutina = ejercicios_por_rutina
+        self._aleatorio = random.Random(semilla)
+        self._tipos = list(self.mezcla)
+        self._pesos = [self.mezcla[t] for t in self._tipos]
+
+    def generar(self, cantidad):
+        """
+        Genera una lista de rutinas.
+        Args:
+            cantidad (int): Cantidad de rutinas.
+        Returns:
+            list de Rutina: Rutinas generadas.
+        """
+        return [self.generar_rutina(i) for i in range(cantidad)]
+
+    def generar_rutina(self, numero):
+        """
+        Genera una rutina con una cantidad aleatoria de ejercicios.
+        Args:
+            numero (int): Número de la rutina, usado en su nombre.
+        Returns:
+            Rutina: Rutina generada.
+        """
+        rnd = self._aleatorio
+        rutina = Rutina(f"{rnd.choice(NOMBRES_RUTINA)} {numero + 1}")
+        for tipo in rnd.choices(self._tipos, self._pesos, k=rnd.randint(*self.ejercicios_por_rutina)):
+            rutina.agregar_ejercicio(getattr(self, "_generar_" + tipo)())
+        return rutina
+
+    def _generar_EjercicioFuerza(self):
+        rnd = self._aleatorio
+        return EjercicioFuerza(
+            rnd.choice(NOMBRES_FUERZA), float(rnd.randrange(10, 160, 5)), rnd.randint(5, 15),
+            rnd.randint(2, 5), rnd.choice([1, 1.5, 2, 3]),
+        )
+
+    def _generar_EjercicioFuerzaDropSet(self):
+        rnd = self._aleatorio
+        return EjercicioFuerzaDropSet(
+            rnd.choice(NOMBRES_FUERZA), float(rnd.randrange(20, 120, 5)), rnd.randint(6, 12),
+            rnd.choice([0.5, 1, 1.5]), rnd.randint(3, 5), rnd.choice([2.5, 5, 10]), rnd.randint(1, 4),
+        )
+
+    def _generar_EjercicioCardio(self):
+        rnd = self._aleatorio
+        return EjercicioCardio(rnd.choice(NOMBRES_CARDIO), round(rnd.uniform(5, 12), 1), rnd.randint(10, 45))
+
+    def _generar_EjercicioCardioHIIT(self):
+        rnd = self._aleatorio
+        velocidad = round(rnd.uniform(5, 9), 1)
+        return EjercicioCardioHIIT(
+            rnd.choice(NOMBRES_CARDIO), velocidad, round(velocidad + rnd.uniform(3, 8), 1),
+            rnd.choice([0.5, 1, 2]), rnd.randint(10, 30),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera una biblioteca de rutinas sintética.")
+    parser.add_argument("--rutinas", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--mezcla", type=leer_mezcla, default=None,
+                        help="Pesos por tipo, por ejemplo EjercicioFuerza=2,EjercicioCardioHIIT=1")
+    parser.add_argument("--salida", default="rutinas_sinteticas.pkl",
+                        help="Archivo a escribir. Para usarlo en la app, copiarlo a datos/rutinas.pkl.")
+    parser.add_argument("--forzar", action="store_true", help="Sobrescribir el archivo de salida si ya existe.")
+    args = parser.parse_args()
+
+    if os.path.exists(args.salida) and not args.forzar:
+        parser.error(f"{args.salida} ya existe; use --forzar para sobrescribirlo.")
+
+    rutinas = GeneradorRutinas(args.semilla, args.mezcla).generar(args.rutinas)
+    os.makedirs(os.path.dirname(args.salida) or ".", exist_ok=True)
+    with open(args.salida, "wb") as f:
+        pickle.dump(rutinas, f)
+    print(f"{len(rutinas)} rutinas escritas en {args.salida}")
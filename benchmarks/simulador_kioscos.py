@@ -0,0 +1,320 @@
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import random
+import shutil
+import tempfile
+import time
+from benchmarks.generador import GeneradorRutinas
+from controlador.controlador import Controlador
+from servidor.prueba_carga import percentil
+
+MEZCLA_POR_DEFECTO = {"cargar_rutinas": 0.5, "crear_rutina": 0.2, "realizar_rutina": 0.3}
+# Segundos que se espera el informe de un kiosco después de su duración antes de darlo por colgado.
+ESPERA_INFORME = 30.0
+
+
+def leer_mezcla_operaciones(texto):
+    """
+    Interpreta una mezcla de operaciones escrita como "operacion=peso,operacion=peso".
+    Args:
+        texto (str): Mezcla en formato texto.
+    Returns:
+        dict: Peso relativo por operación.
+    """
+    mezcla = {}
+    for parte in texto.split(","):
+        nombre, _, peso = parte.partition("=")
+        nombre = nombre.strip()
+        if nombre not in MEZCLA_POR_DEFECTO:
+            raise argparse.ArgumentTypeError(f"Operación desconocida: {nombre}")
+        mezcla[nombre] = float(peso)
+    return mezcla
+
+
+class VistaGuionada:
+    """
+    Vista no bloqueante que responde a los pedidos del controlador con datos
+    preparados de antemano, sin limpiar la pantalla ni esperar al usuario.
+    Atributos:
+        mensajes (list de str): Mensajes emitidos por el controlador (errores de carga o guardado).
+    """
+
+    def __init__(self, generador):
+        """
+        Args:
+            generador (GeneradorRutinas): Generador del que se toman los ejercicios a crear.
+        """
+        self.generador = generador
+        self.mensajes = []
+        self.nombre_rutina = None
+        self._pendientes = []
+
+    def preparar_creacion(self, nombre):
+        """
+        Prepara la rutina que creará el próximo crear_rutina.
+        Args:
+            nombre (str): Nombre único de la rutina.
+        """
+        self.nombre_rutina = nombre
+        self._pendientes = list(self.generador.generar_rutina(0).ejercicios)
+
+    def pedir_nombre_rutina(self):
+        return self.nombre_rutina
+
+    def seleccionar_tipo_ejercicio(self, rutina):
+        return type(self._pendientes[0])
+
+    def seleccionar_subtipo(self, clase_base):
+        return clase_base
+
+    def pedir_datos(self, clase_modelo):
+        ejercicio = self._pendientes.pop(0)
+        datos = dict(vars(ejercicio))
+        if "variacion_reps" in datos:
+            datos["variacion_repeticiones"] = datos.pop("variacion_reps")
+        return datos
+
+    def preguntar_otro_ejercicio(self):
+        return bool(self._pendientes)
+
+    def mostrar_mensaje(self, mensaje):
+        self.mensajes.append(mensaje)
+
+    def mostrar_rutina(self, rutina):
+        pass
+
+    def mostrar_inicio_rutina(self, nombre_rutina):
+        pass
+
+    def mostrar_ejercicio(self, ejercicio, nro_set):
+        pass
+
+    def esperar_fin_ejercicio(self):
+        pass
+
+    def mostrar_descanso(self, minutos):
+        pass
+
+    def mostrar_fin_rutina(self, nombre_rutina):
+        pass
+
+
+def _trabajador(numero, directorio, mezcla, duracion, semilla, cola):
+    """
+    Proceso que simula un kiosco: conduce un Controlador real con una VistaGuionada
+    ejecutando operaciones según la mezcla hasta que se cumple la duración.
+    Envía por la cola su número, las latencias de las operaciones exitosas y de las
+    fallidas, las rutinas que creó y la duración medida de su bucle (sin el arranque).
+    """
+    aleatorio = random.Random(semilla + numero)
+    vista = VistaGuionada(GeneradorRutinas(semilla + numero))
+    controlador = Controlador(vista)
+    controlador.ARCHIVO_RUTINAS = os.path.join(directorio, "rutinas.pkl")
+    controlador.ARCHIVO_HISTORIAL = os.path.join(directorio, "historial.pkl")
+    controlador.cargar_rutinas()
+    vista.mensajes.clear()
+
+    operaciones = list(mezcla)
+    pesos = [mezcla[o] for o in operaciones]
+    resultados = {o: {"latencias": [], "latencias_error": []} for o in operaciones}
+    creadas = []
+    inicio_bucle = time.perf_counter()
+    fin = inicio_bucle + duracion
+
+    while time.perf_counter() < fin:
+        operacion = aleatorio.choices(operaciones, pesos)[0]
+        if operacion == "crear_rutina":
+            nombre = f"kiosco-{numero}-{len(creadas)}"
+            vista.preparar_creacion(nombre)
+            ejecutar = controlador.crear_rutina
+        elif operacion == "realizar_rutina":
+            if not controlador.rutinas:
+                continue
+            rutina = aleatorio.choice(controlador.rutinas)
+            ejecutar = lambda: controlador.realizar_rutina(rutina)
+        else:
+            ejecutar = controlador.cargar_rutinas
+
+        inicio = time.perf_counter()
+        try:
+            ejecutar()
+            error = bool(vista.mensajes)
+        except Exception:
+            error = True
+        latencia = time.perf_counter() - inicio
+        if error:
+            resultados[operacion]["latencias_error"].append(latencia)
+        else:
+            resultados[operacion]["latencias"].append(latencia)
+            if operacion == "crear_rutina":
+                creadas.append(nombre)
+        vista.mensajes.clear()
+
+    cola.put({
+        "numero": numero,
+        "resultados": resultados,
+        "creadas": creadas,
+        "duracion": time.perf_counter() - inicio_bucle,
+    })
+
+
+def _recolectar(trabajadores, cola, limite):
+    """
+    Espera el informe de cada kiosco sin bloquearse por uno que haya fallado.
+    Un kiosco que terminó con código distinto de 0 sin informar, o que sigue sin
+    informar al llegar el límite, se da por fallado (y se termina si sigue vivo).
+    Args:
+        trabajadores (list de multiprocessing.Process): Kioscos, en orden de número.
+        cola (multiprocessing.Queue): Cola por la que informan.
+        limite (float): Instante (time.perf_counter) máximo de espera.
+    Returns:
+        tuple: (informes por número de kiosco, dict de código de salida por kiosco fallado).
+    """
+    informes, fallados = {}, {}
+    while len(informes) + len(fallados) < len(trabajadores):
+        try:
+            informe = cola.get(timeout=0.5)
+            informes[informe["numero"]] = informe
+            continue
+        except queue.Empty:
+            pass
+        vencido = time.perf_counter() > limite
+        for numero, trabajador in enumerate(trabajadores):
+            if numero in informes or numero in fallados:
+                continue
+            # Un kiosco que terminó bien ya dejó su informe en la cola; solo falta leerlo.
+            if not trabajador.is_alive() and trabajador.exitcode != 0:
+                fallados[numero] = trabajador.exitcode
+            elif vencido:
+                trabajador.terminate()
+                trabajador.join()
+                fallados[numero] = trabajador.exitcode
+    return informes, fallados
+
+
+def histograma(latencias, limites_ms=(0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)):
+    """
+    Agrupa latencias en cubetas de escala logarítmica.
+    Args:
+        latencias (list de float): Latencias en segundos.
+        limites_ms (tuple): Límite superior de cada cubeta en milisegundos.
+    Returns:
+        dict: Cantidad por límite superior ("+Inf" para las que superan el último).
+    """
+    cubetas = {str(limite): 0 for limite in limites_ms}
+    cubetas["+Inf"] = 0
+    for latencia in latencias:
+        ms = latencia * 1000
+        for limite in limites_ms:
+            if ms <= limite:
+                cubetas[str(limite)] += 1
+                break
+        else:
+            cubetas["+Inf"] += 1
+    return cubetas
+
+
+def simular(procesos, mezcla, duracion, semilla=0, rutinas_iniciales=100, directorio=None):
+    """
+    Ejecuta una simulación con varios kioscos sobre una misma carpeta de datos.
+    Args:
+        procesos (int): Cantidad de procesos (kioscos).
+        mezcla (dict): Peso relativo de cada operación.
+        duracion (float): Segundos que corre cada kiosco.
+        semilla (int): Semilla de los generadores.
+        rutinas_iniciales (int): Rutinas con las que se inicializa la carpeta.
+        directorio (str o None): Carpeta base de datos; por defecto, una temporal.
+    Returns:
+        dict: Métricas por operación, kioscos fallados y cantidad de actualizaciones perdidas.
+        Los percentiles e histograma son de las operaciones exitosas y las latencias de las
+        fallidas se informan aparte. Las operaciones por segundo suman el ritmo de cada kiosco
+        sobre la duración medida de su bucle, sin contar el arranque de los procesos.
+    """
+    base = tempfile.mkdtemp(prefix="mygymbro_kioscos_", dir=directorio)
+    try:
+        inicial = Controlador(VistaGuionada(None))
+        inicial.ARCHIVO_RUTINAS = os.path.join(base, "rutinas.pkl")
+        inicial.rutinas = GeneradorRutinas(semilla).generar(rutinas_iniciales)
+        inicial.guardar_rutinas()
+
+        cola = multiprocessing.Queue()
+        trabajadores = [
+            multiprocessing.Process(target=_trabajador, args=(n, base, mezcla, duracion, semilla, cola))
+            for n in range(procesos)
+        ]
+        for trabajador in trabajadores:
+            trabajador.start()
+        informes, fallados = _recolectar(trabajadores, cola, time.perf_counter() + duracion + ESPERA_INFORME)
+        informes = list(informes.values())
+        for trabajador in trabajadores:
+            trabajador.join()
+
+        final = Controlador(VistaGuionada(None))
+        final.ARCHIVO_RUTINAS = inicial.ARCHIVO_RUTINAS
+        final.cargar_rutinas()
+        guardadas = {rutina.nombre for rutina in final.rutinas}
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    creadas = [nombre for informe in informes for nombre in informe["creadas"]]
+    operaciones = {}
+    for operacion in mezcla:
+        latencias = sorted(l for i in informes for l in i["resultados"][operacion]["latencias"])
+        latencias_error = sorted(l for i in informes for l in i["resultados"][operacion]["latencias_error"])
+        operaciones[operacion] = {
+            "cantidad": len(latencias),
+            "errores": len(latencias_error),
+            "por_segundo": sum(
+                len(i["resultados"][operacion]["latencias"]) / i["duracion"] for i in informes if i["duracion"]
+            ),
+            "p50_ms": percentil(latencias, 50) * 1000,
+            "p95_ms": percentil(latencias, 95) * 1000,
+            "p99_ms": percentil(latencias, 99) * 1000,
+            "histograma_ms": histograma(latencias),
+            "error_p50_ms": percentil(latencias_error, 50) * 1000,
+            "error_p99_ms": percentil(latencias_error, 99) * 1000,
+        }
+    duraciones = [i["duracion"] for i in informes]
+    return {
+        "procesos": procesos,
+        "duracion_segundos": sum(duraciones) / len(duraciones) if duraciones else 0.0,
+        "kioscos_fallados": {str(numero): codigo for numero, codigo in sorted(fallados.items())},
+        "operaciones": operaciones,
+        "rutinas_creadas": len(creadas),
+        "actualizaciones_perdidas": sum(1 for nombre in creadas if nombre not in guardadas),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simula varios kioscos compartiendo la misma carpeta de datos.")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="Cantidades de kioscos a simular, una corrida por valor.")
+    parser.add_argument("--duracion", type=float, default=5.0, help="Segundos por corrida.")
+    parser.add_argument("--mezcla", type=leer_mezcla_operaciones, default=MEZCLA_POR_DEFECTO,
+                        help="Pesos por operación, por ejemplo cargar_rutinas=5,crear_rutina=1,realizar_rutina=2")
+    parser.add_argument("--rutinas", type=int, default=100, help="Rutinas iniciales en la carpeta compartida.")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--datos", default=None,
+                        help="Carpeta donde crear los datos compartidos (por ejemplo, en otro disco o en red).")
+    parser.add_argument("--salida", default=None, help="Archivo JSON con los resultados completos.")
+    args = parser.parse_args()
+
+    corridas = []
+    for procesos in args.procesos:
+        resultado = simular(procesos, args.mezcla, args.duracion, args.semilla, args.rutinas, args.datos)
+        corridas.append(resultado)
+        print(f"\n{procesos} kiosco/s - {resultado['duracion_segundos']:.1f} s - "
+              f"actualizaciones perdidas: {resultado['actualizaciones_perdidas']}/{resultado['rutinas_creadas']}")
+        for numero, codigo in resultado["kioscos_fallados"].items():
+            print(f"  ❌ kiosco {numero} falló sin informar (código de salida {codigo})")
+        for operacion, datos in resultado["operaciones"].items():
+            print(f"  {operacion:<16} {datos['cantidad']:>7} ops {datos['por_segundo']:>9.1f} ops/s "
+                  f"p50 {datos['p50_ms']:>8.3f} ms  p99 {datos['p99_ms']:>8.3f} ms  errores {datos['errores']}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(corridas, f, indent=2, ensure_ascii=False)
+        print(f"\nResultados escritos en {args.salida}")
@@ -0,0 +1,229 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from benchmarks.generador import GeneradorRutinas, leer_mezcla
+from controlador.controlador import Controlador
+from vista.vista import VistaCLI
+from vista.vista_api import VistaAPI
+
+TAMANOS_POR_DEFECTO = [10, 100, 1000, 10000]
+
+# Parámetros que deben coincidir con los de la línea base para que la comparación tenga sentido.
+PARAMETROS_COMPARABLES = ("semilla", "mezcla", "repeticiones")
+
+# Sentido de cada métrica: True si un valor mayor es mejor.
+METRICAS = {
+    "guardar_segundos": False,
+    "cargar_segundos": False,
+    "tamano_archivo_bytes": False,
+    "calorias_por_segundo": True,
+    "render_seleccionar_segundos": False,
+    "memoria_por_rutina_bytes": False,
+}
+
+
+class VistaBenchmark(VistaCLI):
+    """Vista CLI que no limpia la terminal ni espera al usuario, para medir solo el render."""
+
+    def limpiar_pantalla(self):
+        pass
+
+    def _leer_entrada(self, mensaje):
+        return "1"
+
+
+def _mejor_tiempo(funcion, repeticiones):
+    """
+    Ejecuta una función varias veces y devuelve el menor tiempo observado.
+    Args:
+        funcion (callable): Función sin argumentos a medir.
+        repeticiones (int): Cantidad de ejecuciones.
+    Returns:
+        float: Menor duración en segundos.
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def medir_tamano(tamano, semilla, mezcla, repeticiones, directorio):
+    """
+    Mide todas las métricas para una biblioteca de un tamaño dado.
+    Args:
+        tamano (int): Cantidad de rutinas.
+        semilla (int): Semilla del generador.
+        mezcla (dict o None): Mezcla de tipos de ejercicio.
+        repeticiones (int): Repeticiones de cada medición de tiempo.
+        directorio (str): Carpeta temporal para el archivo de rutinas.
+    Returns:
+        dict: Valor de cada métrica de METRICAS.
+    """
+    # El generador y una corrida de calentamiento quedan fuera de tracemalloc para que
+    # la memoria medida sea solo la de las rutinas, también en los tamaños chicos.
+    GeneradorRutinas(semilla + 1, mezcla).generar(100)
+    generador = GeneradorRutinas(semilla, mezcla)
+    tracemalloc.start()
+    rutinas = generador.generar(tamano)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    controlador = Controlador(VistaAPI())
+    controlador.ARCHIVO_RUTINAS = os.path.join(directorio, f"rutinas-{tamano}.pkl")
+    controlador.rutinas = rutinas
+
+    guardar = _mejor_tiempo(controlador.guardar_rutinas, repeticiones)
+    tamano_archivo = os.path.getsize(controlador.ARCHIVO_RUTINAS)
+    cargar = _mejor_tiempo(controlador.cargar_rutinas, repeticiones)
+    errores = controlador.vista.obtener_mensajes()
+    if errores:
+        raise RuntimeError("; ".join(errores))
+    os.remove(controlador.ARCHIVO_RUTINAS)
+
+    ejercicios = [e for rutina in rutinas for e in rutina.ejercicios]
+    calorias = _mejor_tiempo(lambda: [e.estimar_calorias() for e in ejercicios], repeticiones)
+
+    vista = VistaBenchmark()
+    with contextlib.redirect_stdout(io.StringIO()):
+        render = _mejor_tiempo(lambda: vista.seleccionar_rutina(rutinas), repeticiones)
+
+    return {
+        "guardar_segundos": guardar,
+        "cargar_segundos": cargar,
+        "tamano_archivo_bytes": tamano_archivo,
+        "calorias_por_segundo": len(ejercicios) / calorias if calorias else 0.0,
+        "render_seleccionar_segundos": render,
+        "memoria_por_rutina_bytes": memoria / tamano if tamano else 0.0,
+    }
+
+
+def ejecutar_suite(tamanos, semilla=0, mezcla=None, repeticiones=3):
+    """
+    Ejecuta la suite completa para cada tamaño de biblioteca.
+    Returns:
+        dict: Parámetros de la ejecución y resultados por tamaño.
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory(prefix="mygymbro_bench_") as directorio:
+        for tamano in tamanos:
+            resultados[str(tamano)] = medir_tamano(tamano, semilla, mezcla, repeticiones, directorio)
+    return {
+        "semilla": semilla,
+        "mezcla": GeneradorRutinas(semilla, mezcla).mezcla,
+        "repeticiones": repeticiones,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def parametros_distintos(actual, base):
+    """
+    Lista los parámetros de ejecución que no coinciden con los de la línea base.
+    Args:
+        actual (dict): Resultados de la ejecución actual.
+        base (dict): Resultados de la línea base.
+    Returns:
+        list de str: Descripción de cada parámetro distinto.
+    """
+    distintos = []
+    for nombre in PARAMETROS_COMPARABLES:
+        # Se normaliza con JSON para comparar igual que quedó guardado en la línea base.
+        valor = json.loads(json.dumps(actual.get(nombre)))
+        if valor != base.get(nombre):
+            distintos.append(f"{nombre}: línea base {base.get(nombre)!r}, actual {valor!r}")
+    return distintos
+
+
+def comparar(actual, base, umbral, umbrales_metrica=None):
+    """
+    Compara resultados contra una línea base.
+    Una métrica es una regresión si empeora en más del umbral relativo
+    (por ejemplo 0.2 = 20%) en su sentido correspondiente.
+    Args:
+        actual (dict): Resultados de la ejecución actual.
+        base (dict): Resultados de la línea base.
+        umbral (float): Umbral relativo por defecto.
+        umbrales_metrica (dict o None): Umbral específico por métrica.
+    Returns:
+        list de str: Descripción de cada regresión encontrada.
+    """
+    umbrales_metrica = umbrales_metrica or {}
+    regresiones = []
+    for tamano, metricas in actual["resultados"].items():
+        metricas_base = base["resultados"].get(tamano)
+        if metricas_base is None:
+            continue
+        for nombre, mayor_es_mejor in METRICAS.items():
+            valor, valor_base = metricas.get(nombre), metricas_base.get(nombre)
+            if not valor_base or valor is None:
+                continue
+            cambio = (valor - valor_base) / valor_base
+            if mayor_es_mejor:
+                cambio = -cambio
+            limite = umbrales_metrica.get(nombre, umbral)
+            if cambio > limite:
+                regresiones.append(
+                    f"{tamano} rutinas - {nombre}: {valor_base:.6g} -> {valor:.6g} "
+                    f"({cambio:+.1%} peor, umbral {limite:.0%})"
+                )
+    return regresiones
+
+
+def _leer_umbral_metrica(texto):
+    nombre, _, valor = texto.partition("=")
+    if nombre not in METRICAS:
+        raise argparse.ArgumentTypeError(f"Métrica desconocida: {nombre}")
+    return nombre, float(valor)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suite de benchmarks reproducible de MyGymBro.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS_POR_DEFECTO,
+                        help="Cantidades de rutinas a medir (de 10 a 1000000).")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--mezcla", type=leer_mezcla, default=None,
+                        help="Pesos por tipo, por ejemplo EjercicioFuerza=2,EjercicioCardioHIIT=1")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--salida", default="benchmark.json", help="Archivo JSON de resultados.")
+    parser.add_argument("--linea-base", help="Archivo JSON de resultados con el que comparar.")
+    parser.add_argument("--umbral", type=float, default=0.2, help="Empeoramiento relativo tolerado (0.2 = 20%%).")
+    parser.add_argument("--umbral-metrica", type=_leer_umbral_metrica, action="append", default=[],
+                        metavar="METRICA=UMBRAL", help="Umbral específico para una métrica.")
+    args = parser.parse_args()
+
+    actual = ejecutar_suite(args.tamanos, args.semilla, args.mezcla, args.repeticiones)
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(actual, f, indent=2, ensure_ascii=False)
+
+    for tamano, metricas in actual["resultados"].items():
+        print(f"{tamano} rutinas")
+        for nombre, valor in metricas.items():
+            print(f"  {nombre}: {valor:.6g}")
+    print(f"Resultados escritos en {args.salida}")
+
+    if args.linea_base:
+        with open(args.linea_base, encoding="utf-8") as f:
+            base = json.load(f)
+        distintos = parametros_distintos(actual, base)
+        if distintos:
+            print("❌ La línea base se midió con otros parámetros; no se puede comparar:")
+            for distinto in distintos:
+                print(f"  {distinto}")
+            sys.exit(2)
+        regresiones = comparar(actual, base, args.umbral, dict(args.umbral_metrica))
+        if regresiones:
+            print("❌ Regresiones respecto de la línea base:")
+            for regresion in regresiones:
+                print(f"  {regresion}")
+            sys.exit(1)
+        print("✅ Sin regresiones respecto de la línea base.")
@@ -1,6 +1,10 @@
 import os
 import pickle
+from instrumentacion.metricas import REGISTRO, medido
 from modelo.rutina import Rutina
+from modelo.historial import Historial
+from modelo.progresion import MotorProgresion
+from modelo.sesion import SesionRutina
 from modelo.ejercicio_fuerza import EjercicioFuerza, EjercicioFuerzaDropSet
 from modelo.ejercicio_cardio import EjercicioCardio, EjercicioCardioHIIT
 
@@ -11,14 +15,21 @@ class Controlador:
     """
 
     ARCHIVO_RUTINAS = os.path.join("datos", "rutinas.pkl")
+    ARCHIVO_HISTORIAL = os.path.join("datos", "historial.pkl")
+    SOCIO_POR_DEFECTO = "general"
 
     def __init__(self, vista):
         """
         Inicializa el controlador con una vista y una lista de rutinas vacía.
+        El atributo version se incrementa cada vez que cambia la lista de rutinas.
         :param vista: Objeto que representa la vista (interfaz de usuario).
         """
         self.vista = vista
         self.rutinas = []
+        self.version = 0
+        self.historial = Historial()
+        self._posicion_historial = 0
+        self._motor_progresion = None
 
     def iniciar(self):
         """
@@ -26,6 +37,7 @@ class Controlador:
         Carga las rutinas guardadas y muestra el menú principal.
         """
         self.cargar_rutinas()
+        self.cargar_historial()
         while True:
             opcion = self.vista.mostrar_menu()
             if opcion == "1":
@@ -61,8 +73,7 @@ class Controlador:
 
             if not self.vista.preguntar_otro_ejercicio():
                 break
-        self.rutinas.append(rutina)
-        self.guardar_rutinas()
+        self.agregar_rutina(rutina)
         self.vista.mostrar_rutina(rutina)
 
     def empezar_rutina(self):
@@ -79,28 +90,75 @@ class Controlador:
 
         rutina = self.vista.seleccionar_rutina(self.rutinas)
         if rutina:
-            self.realizar_rutina(rutina)
+            self.realizar_rutina(rutina, self.vista.pedir_socio())
 
-    def realizar_rutina(self, rutina):
+    def realizar_rutina(self, rutina, socio=None):
         """
         Ejecuta los ejercicios de una rutina, mostrando instrucciones y descansos por set.
+        Al terminar, la registra en el historial del socio.
         :param rutina: Objeto de tipo Rutina a ejecutar.
+        :param socio: Identificador del socio que la realiza.
         """
         self.vista.mostrar_inicio_rutina(rutina.nombre)
 
-        for ejercicio in rutina.ejercicios:
-            sets = int(getattr(ejercicio, 'sets', 1))
-
-            for numero_set in range(1, sets + 1):
-                self.vista.mostrar_ejercicio(ejercicio,numero_set)
+        for paso in self.iniciar_sesion(rutina, socio).pasos:
+            if paso["tipo"] == "ejercicio":
+                self.vista.mostrar_ejercicio(paso["ejercicio"], paso["numero_set"])
                 self.vista.esperar_fin_ejercicio()
+            else:
+                self.vista.mostrar_descanso(paso["minutos"])
 
-                descanso = getattr(ejercicio, 'descanso', None)
-                if isinstance(descanso, (int, float)) and descanso > 0 and numero_set < sets:
-                    self.vista.mostrar_descanso(descanso)
-
+        self.registrar_sesion(rutina, socio)
         self.vista.mostrar_fin_rutina(rutina.nombre)
 
+    def iniciar_sesion(self, rutina, socio=None):
+        """
+        Crea una sesión que recorre la rutina paso a paso.
+        :param rutina: Objeto de tipo Rutina a realizar.
+        :param socio: Identificador del socio que realiza la rutina.
+        :return: Objeto SesionRutina posicionado en el primer paso.
+        """
+        return SesionRutina(rutina, socio or self.SOCIO_POR_DEFECTO)
+
+    def registrar_sesion(self, rutina, socio=None):
+        """
+        Agrega al historial los ejercicios de una rutina completada.
+        Las filas se agregan al final del archivo y luego se leen junto con las
+        que hayan agregado otros kioscos, así ninguno pisa las sesiones de otro.
+        :param rutina: Objeto de tipo Rutina completada.
+        :param socio: Identificador del socio que la realizó.
+        """
+        filas = [Historial.crear_fila(socio or self.SOCIO_POR_DEFECTO, e) for e in rutina.ejercicios]
+        if not filas:
+            return
+        if self.guardar_historial(filas):
+            self.cargar_historial()
+        else:
+            self.historial.agregar_filas(filas)
+
+    def recomendar_progresion(self, socio=None, fecha=None):
+        """
+        Sugiere la carga de la próxima sesión a partir del historial.
+        :param socio: Identificador del socio, o None para todos los socios.
+        :param fecha: Fecha de la próxima sesión (por defecto, hoy).
+        :return: Lista de recomendaciones del socio, o diccionario por socio si no se indica uno.
+        """
+        if self._motor_progresion is None or self._motor_progresion.historial is not self.historial:
+            self._motor_progresion = MotorProgresion(self.historial)
+        if socio is None:
+            return self._motor_progresion.recomendar_todos(fecha)
+        return self._motor_progresion.recomendar(socio, fecha)
+
+    def agregar_rutina(self, rutina):
+        """
+        Agrega una rutina ya construida y guarda la lista actualizada.
+        :param rutina: Objeto de tipo Rutina a agregar.
+        """
+        self.rutinas.append(rutina)
+        self.version += 1
+        self.guardar_rutinas()
+
+    @medido("controlador.guardar_rutinas")
     def guardar_rutinas(self):
         """
         Guarda la lista de rutinas actuales en un archivo utilizando pickle.
@@ -110,9 +168,11 @@ class Controlador:
             os.makedirs(os.path.dirname(self.ARCHIVO_RUTINAS), exist_ok=True)
             with open(self.ARCHIVO_RUTINAS, 'wb') as f:
                 pickle.dump(self.rutinas, f)
+                REGISTRO.incrementar("controlador.bytes_escritos", f.tell())
         except Exception as e:
             self.vista.mostrar_mensaje(f"❌ Error al guardar las rutinas: {e}")
     
+    @medido("controlador.cargar_rutinas")
     def cargar_rutinas(self):
         """
         Carga las rutinas guardadas desde un archivo utilizando pickle.
@@ -122,6 +182,56 @@ class Controlador:
             try:
                 with open(self.ARCHIVO_RUTINAS, 'rb') as f:
                     self.rutinas = pickle.load(f)
+                    REGISTRO.incrementar("controlador.bytes_leidos", f.tell())
             except Exception as e:
                 self.vista.mostrar_mensaje(f"⚠️ No se pudo cargar las rutinas guardadas: {e}")
                 self.rutinas = []
+            self.version += 1
+
+    @medido("controlador.guardar_historial")
+    def guardar_historial(self, filas):
+        """
+        Agrega un lote de filas al final del archivo de historial utilizando pickle.
+        El archivo solo crece: cada lote se escribe con una única escritura en modo append,
+        de modo que varios procesos pueden compartirlo sin reescribir lo de los demás.
+        Crea la carpeta si no existe.
+        :param filas: Filas creadas con Historial.crear_fila.
+        :return: True si el lote se escribió.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.ARCHIVO_HISTORIAL), exist_ok=True)
+            datos = pickle.dumps(filas)
+            with open(self.ARCHIVO_HISTORIAL, 'ab') as f:
+                f.write(datos)
+            REGISTRO.incrementar("controlador.bytes_escritos", len(datos))
+            return True
+        except Exception as e:
+            self.vista.mostrar_mensaje(f"❌ Error al guardar el historial: {e}")
+            return False
+
+    @medido("controlador.cargar_historial")
+    def cargar_historial(self):
+        """
+        Lee los lotes agregados al archivo de historial desde la última lectura.
+        Un lote incompleto al final (otro proceso escribiendo) se vuelve a leer la próxima vez.
+        Si el archivo se achicó, se recarga desde el principio.
+        Si hay error al leer, muestra un mensaje y conserva lo ya cargado.
+        """
+        if not os.path.exists(self.ARCHIVO_HISTORIAL):
+            return
+        try:
+            with open(self.ARCHIVO_HISTORIAL, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < self._posicion_historial:
+                    self.historial = Historial()
+                    self._posicion_historial = 0
+                f.seek(self._posicion_historial)
+                while True:
+                    try:
+                        lote = pickle.load(f)
+                    except (EOFError, pickle.UnpicklingError):
+                        break
+                    self.historial.agregar_filas(lote)
+                    REGISTRO.incrementar("controlador.bytes_leidos", f.tell() - self._posicion_historial)
+                    self._posicion_historial = f.tell()
+        except Exception as e:
+            self.vista.mostrar_mensaje(f"⚠️ No se pudo cargar el historial: {e}")
@@ -0,0 +1,332 @@
+import functools
+import json
+import re
+import sys
+import threading
+import time
+
+
+class Resumen:
+    """
+    Estadísticas acumuladas de una serie de valores (duraciones u observaciones).
+    Atributos:
+        cantidad (int): Cantidad de valores registrados.
+        suma (float): Suma de los valores.
+        minimo (float): Menor valor registrado.
+        maximo (float): Mayor valor registrado.
+    """
+
+    def __init__(self):
+        """Inicializa un resumen vacío."""
+        self.cantidad = 0
+        self.suma = 0.0
+        self.minimo = float("inf")
+        self.maximo = float("-inf")
+
+    def agregar(self, valor):
+        """
+        Agrega un valor al resumen.
+        Args:
+            valor (float): Valor a registrar.
+        """
+        self.cantidad += 1
+        self.suma += valor
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def a_diccionario(self):
+        """
+        Returns:
+            dict: Cantidad, suma, mínimo, máximo y promedio.
+        """
+        return {
+            "cantidad": self.cantidad,
+            "suma": self.suma,
+            "minimo": self.minimo if self.cantidad else 0.0,
+            "maximo": self.maximo if self.cantidad else 0.0,
+            "promedio": self.suma / self.cantidad if self.cantidad else 0.0,
+        }
+
+
+class _TramoNulo:
+    """Tramo que no mide nada; se usa cuando el registro está desactivado."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Tramo:
+    """Tramo que mide el tiempo transcurrido dentro de un bloque with."""
+
+    def __init__(self, registro, nombre):
+        self.registro = registro
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registro.registrar_tramo(self.nombre, time.perf_counter() - self.inicio)
+        return False
+
+
+_TRAMO_NULO = _TramoNulo()
+
+
+class RegistroMetricas:
+    """
+    Registro en memoria de métricas del proceso.
+    Guarda tramos de tiempo (en segundos), observaciones de valores arbitrarios
+    y contadores. Mientras está desactivado no registra nada y los métodos
+    decorados con medido se ejecutan sin envoltura.
+    Atributos:
+        activo (bool): Si el registro acepta métricas.
+        tramos (dict): Resúmenes de duración por nombre.
+        observaciones (dict): Resúmenes de valores por nombre.
+        contadores (dict): Contadores por nombre.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío y desactivado."""
+        self.activo = False
+        self.tramos = {}
+        self.observaciones = {}
+        self.contadores = {}
+        self._lock = threading.Lock()
+
+    def activar(self):
+        """Comienza a registrar métricas e instala las envolturas de los métodos medidos."""
+        self.activo = True
+        _instalar_envolturas(True)
+
+    def desactivar(self):
+        """Deja de registrar métricas, conservando las ya registradas, y quita las envolturas."""
+        self.activo = False
+        _instalar_envolturas(False)
+
+    def reiniciar(self):
+        """Descarta todas las métricas registradas."""
+        with self._lock:
+            self.tramos.clear()
+            self.observaciones.clear()
+            self.contadores.clear()
+
+    def tramo(self, nombre):
+        """
+        Devuelve un administrador de contexto que mide la duración de un bloque.
+        Args:
+            nombre (str): Nombre del tramo.
+        Returns:
+            Administrador de contexto para usar con with.
+        """
+        if not self.activo:
+            return _TRAMO_NULO
+        return _Tramo(self, nombre)
+
+    def registrar_tramo(self, nombre, segundos):
+        """
+        Registra la duración de un tramo.
+        Args:
+            nombre (str): Nombre del tramo.
+            segundos (float): Duración medida.
+        """
+        if not self.activo:
+            return
+        with self._lock:
+            resumen = self.tramos.get(nombre)
+            if resumen is None:
+                resumen = self.tramos[nombre] = Resumen()
+            resumen.agregar(segundos)
+
+    def observar(self, nombre, valor):
+        """
+        Registra una observación de un valor (por ejemplo, el desvío de un temporizador).
+        Args:
+            nombre (str): Nombre de la observación.
+            valor (float): Valor observado.
+        """
+        if not self.activo:
+            return
+        with self._lock:
+            resumen = self.observaciones.get(nombre)
+            if resumen is None:
+                resumen = self.observaciones[nombre] = Resumen()
+            resumen.agregar(valor)
+
+    def incrementar(self, nombre, valor=1):
+        """
+        Incrementa un contador.
+        Args:
+            nombre (str): Nombre del contador.
+            valor (float): Cantidad a sumar.
+        """
+        if not self.activo:
+            return
+        with self._lock:
+            self.contadores[nombre] = self.contadores.get(nombre, 0) + valor
+
+    def a_diccionario(self):
+        """
+        Returns:
+            dict: Todas las métricas registradas.
+        """
+        with self._lock:
+            return {
+                "tramos": {n: r.a_diccionario() for n, r in sorted(self.tramos.items())},
+                "observaciones": {n: r.a_diccionario() for n, r in sorted(self.observaciones.items())},
+                "contadores": dict(sorted(self.contadores.items())),
+            }
+
+    def a_json(self):
+        """
+        Returns:
+            str: Métricas serializadas como JSON.
+        """
+        return json.dumps(self.a_diccionario(), indent=2, ensure_ascii=False)
+
+    def a_prometheus(self, prefijo="mygymbro"):
+        """
+        Serializa las métricas en el formato de texto de Prometheus.
+        Los tramos y observaciones se exportan como summary (con _count y _sum)
+        más dos gauges con el mínimo y el máximo.
+        Args:
+            prefijo (str): Prefijo de los nombres de las métricas.
+        Returns:
+            str: Métricas en formato de texto de Prometheus.
+        """
+        datos = self.a_diccionario()
+        lineas = []
+        for grupo, sufijo in (("tramos", "_segundos"), ("observaciones", "")):
+            for nombre, resumen in datos[grupo].items():
+                base = _nombre_prometheus(prefijo, nombre) + sufijo
+                lineas.append(f"# TYPE {base} summary")
+                lineas.append(f"{base}_count {resumen['cantidad']}")
+                lineas.append(f"{base}_sum {resumen['suma']!r}")
+                for extremo in ("minimo", "maximo"):
+                    lineas.append(f"# TYPE {base}_{extremo} gauge")
+                    lineas.append(f"{base}_{extremo} {resumen[extremo]!r}")
+        for nombre, valor in datos["contadores"].items():
+            base = _nombre_prometheus(prefijo, nombre) + "_total"
+            lineas.append(f"# TYPE {base} counter")
+            lineas.append(f"{base} {valor!r}")
+        return "\n".join(lineas) + "\n"
+
+    def volcar(self, ruta):
+        """
+        Escribe las métricas en un archivo.
+        Usa el formato de Prometheus si la extensión es .prom o .txt, y JSON en otro caso.
+        Args:
+            ruta (str): Ruta del archivo de salida.
+        """
+        contenido = self.a_prometheus() if ruta.endswith((".prom", ".txt")) else self.a_json()
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(contenido)
+
+
+def _nombre_prometheus(prefijo, nombre):
+    """Convierte un nombre con puntos en un nombre de métrica válido para Prometheus."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", f"{prefijo}_{nombre}")
+
+
+REGISTRO = RegistroMetricas()
+
+
+# (módulo, nombre calificado, función original, envoltura) de cada función decorada.
+_INSTRUMENTADOS = []
+
+# Acumuladores de espera de las pantallas en curso, de la más externa a la más interna.
+_ESPERAS = []
+
+
+def _instalar_envolturas(activo):
+    """
+    Reemplaza cada función decorada por su envoltura, o restaura la original.
+    Args:
+        activo (bool): True para instalar las envolturas, False para quitarlas.
+    """
+    for modulo, nombre_calificado, original, envoltura in _INSTRUMENTADOS:
+        partes = nombre_calificado.split(".")
+        contenedor = sys.modules[modulo]
+        for parte in partes[:-1]:
+            contenedor = getattr(contenedor, parte)
+        setattr(contenedor, partes[-1], envoltura if activo else original)
+
+
+def _registrar_instrumentado(funcion, envoltura):
+    """
+    Registra una función decorada y devuelve la versión que corresponde al estado actual.
+    Las envolturas se instalan recién al activar el registro, así que con el registro
+    desactivado los métodos medidos no pagan ningún costo. Solo se admiten funciones
+    y métodos definidos a nivel de módulo o de clase.
+    """
+    functools.update_wrapper(envoltura, funcion)
+    _INSTRUMENTADOS.append((funcion.__module__, funcion.__qualname__, funcion, envoltura))
+    return envoltura if REGISTRO.activo else funcion
+
+
+def medido(nombre):
+    """
+    Decorador que registra la duración de cada llamada como un tramo.
+    Args:
+        nombre (str): Nombre del tramo.
+    """
+
+    def decorador(funcion):
+        def envoltura(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                REGISTRO.registrar_tramo(nombre, time.perf_counter() - inicio)
+
+        return _registrar_instrumentado(funcion, envoltura)
+
+    return decorador
+
+
+def medido_pantalla(nombre):
+    """
+    Decorador para pantallas que esperan al usuario o a un temporizador.
+    Registra dos tramos por llamada: nombre, con el tiempo de render (la duración
+    total menos las esperas informadas con registrar_espera), y nombre + ".espera".
+    Args:
+        nombre (str): Nombre del tramo de la pantalla.
+    """
+
+    def decorador(funcion):
+        def envoltura(*args, **kwargs):
+            espera = [0.0]
+            _ESPERAS.append(espera)
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - inicio
+                _ESPERAS.pop()
+                REGISTRO.registrar_tramo(nombre, total - espera[0])
+                REGISTRO.registrar_tramo(nombre + ".espera", espera[0])
+
+        return _registrar_instrumentado(funcion, envoltura)
+
+    return decorador
+
+
+def registrar_espera(nombre, segundos):
+    """
+    Registra un tiempo de espera (del usuario o de un temporizador) como tramo
+    y lo descuenta del render de todas las pantallas en curso.
+    Args:
+        nombre (str): Nombre del tramo de espera.
+        segundos (float): Duración de la espera.
+    """
+    if not REGISTRO.activo:
+        return
+    REGISTRO.registrar_tramo(nombre, segundos)
+    for espera in _ESPERAS:
+        espera[0] += segundos
@@ -0,0 +1,63 @@
+import cProfile
+import os
+import time
+import tracemalloc
+
+
+class PerfiladorSesion:
+    """
+    Perfilado opcional de una sesión completa con cProfile y tracemalloc.
+    Al detenerse escribe en el directorio indicado un archivo .prof
+    (legible con pstats o snakeviz) y un resumen de memoria en texto.
+    Atributos:
+        directorio (str): Carpeta donde se escriben los perfiles.
+        lineas_memoria (int): Cantidad de líneas de código a listar en el resumen de memoria.
+    """
+
+    def __init__(self, directorio, lineas_memoria=25):
+        """
+        Args:
+            directorio (str): Carpeta donde se escriben los perfiles.
+            lineas_memoria (int): Cantidad de líneas a listar en el resumen de memoria.
+        """
+        self.directorio = directorio
+        self.lineas_memoria = lineas_memoria
+        self._perfil = None
+
+    def iniciar(self):
+        """Comienza a perfilar CPU y memoria."""
+        tracemalloc.start()
+        self._perfil = cProfile.Profile()
+        self._perfil.enable()
+
+    def detener(self):
+        """
+        Detiene el perfilado y escribe los resultados.
+        Returns:
+            tuple de str: Rutas del perfil de CPU y del resumen de memoria.
+        """
+        self._perfil.disable()
+        instantanea = tracemalloc.take_snapshot()
+        actual, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        os.makedirs(self.directorio, exist_ok=True)
+        marca = time.strftime("%Y%m%d-%H%M%S")
+        ruta_cpu = os.path.join(self.directorio, f"sesion-{marca}.prof")
+        ruta_memoria = os.path.join(self.directorio, f"memoria-{marca}.txt")
+
+        self._perfil.dump_stats(ruta_cpu)
+        with open(ruta_memoria, "w", encoding="utf-8") as f:
+            f.write(f"Memoria actual: {actual} bytes\nPico de memoria: {pico} bytes\n\n")
+            for estadistica in instantanea.statistics("lineno")[:self.lineas_memoria]:
+                f.write(f"{estadistica}\n")
+        self._perfil = None
+        return ruta_cpu, ruta_memoria
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, *exc):
+        self.detener()
+        return False
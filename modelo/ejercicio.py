@@ -35,4 +35,20 @@ class Ejercicio(ABC):
         Método polimórfico que estima las calorías quemadas.
         Cada subclase implementa su propia fórmula.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def a_diccionario(self):
+        """
+        Devuelve una representación serializable del ejercicio.
+        Incluye los atributos de la instancia, el tipo, el subtipo,
+        la descripción y las calorías estimadas.
+        Returns:
+            dict: Datos del ejercicio.
+        """
+
+        datos = dict(vars(self))
+        datos["tipo"] = type(self).__name__
+        datos["subtipo"] = getattr(self, "subtipo", type(self).__name__)
+        datos["descripcion"] = self.descripcion()
+        datos["calorias"] = self.estimar_calorias()
+        return datos
@@ -1,3 +1,4 @@
+from instrumentacion.metricas import medido
 from modelo.ejercicio import Ejercicio
 
 class EjercicioCardio(Ejercicio):
@@ -32,6 +33,7 @@ class EjercicioCardio(Ejercicio):
         """
         return f"Ejercicio de cardio {self.nombre_ejercicio}: {self.tiempo} min a {self.velocidad_regular} km/h"
     
+    @medido("modelo.EjercicioCardio.estimar_calorias")
     def estimar_calorias(self):
         """
         Devuelve un estimativo de la cantidad de calorías quemadas durante el ejercicio.
@@ -77,6 +79,7 @@ class EjercicioCardioHIIT(EjercicioCardio):
         return f"{self.subtipo}: alternar {self.velocidad_regular}/{self.velocidad_intensa} km/h cada {self.intervalo} minuto/s por {self.tiempo} min"
     
     
+    @medido("modelo.EjercicioCardioHIIT.estimar_calorias")
     def estimar_calorias(self):
         """
         Devuelve un estimativo de la cantidad de calorías quemadas durante el ejercicio.
@@ -1,3 +1,4 @@
+from instrumentacion.metricas import medido
 from modelo.ejercicio import Ejercicio
 
 class EjercicioFuerza(Ejercicio):
@@ -41,6 +42,7 @@ class EjercicioFuerza(Ejercicio):
             f"descanso de {self.descanso} minuto/s"
         )
 
+    @medido("modelo.EjercicioFuerza.estimar_calorias")
     def estimar_calorias(self):
         """
         Estima la cantidad de calorías que se generan durante el ejercicio.
@@ -86,6 +88,7 @@ class EjercicioFuerzaDropSet(EjercicioFuerza):
 
         return f"{self.subtipo} - {self.nombre_ejercicio}: empieza con {self.peso_maximo}kg y {self.repeticiones} reps. Disminuye {self.variacion_peso}kg, aumenta {self.variacion_reps} reps. Descanso de {self.descanso} minuto/s por {self.sets} serie/s."
 
+    @medido("modelo.EjercicioFuerzaDropSet.estimar_calorias")
     def estimar_calorias(self):
         """
         Estima la cantidad de calorías gastadas considerando todos los sets.
@@ -0,0 +1,72 @@
+import datetime
+from array import array
+
+
+class Historial:
+    """
+    Historial de ejercicios realizados, guardado por columnas.
+    Cada registro corresponde a un ejercicio completado por un socio en una fecha.
+    Las columnas numéricas se guardan como arreglos de floats para poder
+    recorrerlas en bloque sin crear un objeto por registro.
+    Atributos:
+        columnas (dict): Columna por nombre; todas tienen el mismo largo.
+    """
+
+    COLUMNAS_TEXTO = ("socio", "ejercicio", "tipo")
+    COLUMNAS_NUMERICAS = (
+        "fecha", "peso", "repeticiones", "sets",
+        "velocidad_regular", "velocidad_intensa", "intervalo", "tiempo",
+    )
+
+    def __init__(self):
+        """Inicializa un historial vacío."""
+        self.columnas = {nombre: [] for nombre in self.COLUMNAS_TEXTO}
+        self.columnas.update({nombre: array("d") for nombre in self.COLUMNAS_NUMERICAS})
+
+    def __len__(self):
+        return len(self.columnas["fecha"])
+
+    @classmethod
+    def crear_fila(cls, socio, ejercicio, fecha=None):
+        """
+        Arma una fila del historial a partir de un ejercicio realizado.
+        Los atributos que el tipo de ejercicio no tiene se guardan como 0.
+        Args:
+            socio (str): Identificador del socio.
+            ejercicio (Ejercicio): Ejercicio completado.
+            fecha (datetime.date o None): Fecha de realización (por defecto, hoy).
+        Returns:
+            tuple: Valores en el orden de COLUMNAS_TEXTO seguido de COLUMNAS_NUMERICAS.
+        """
+        fecha = fecha or datetime.date.today()
+        return (
+            socio, ejercicio.nombre_ejercicio, type(ejercicio).__name__,
+            float(fecha.toordinal()), float(getattr(ejercicio, "peso_maximo", 0)),
+        ) + tuple(float(getattr(ejercicio, nombre, 0)) for nombre in cls.COLUMNAS_NUMERICAS[2:])
+
+    def agregar_filas(self, filas):
+        """
+        Agrega filas creadas con crear_fila al final del historial.
+        Args:
+            filas (list de tuple): Filas a agregar.
+        """
+        nombres = self.COLUMNAS_TEXTO + self.COLUMNAS_NUMERICAS
+        for nombre, valores in zip(nombres, zip(*filas)):
+            self.columnas[nombre].extend(valores)
+
+    def registrar(self, socio, ejercicio, fecha=None):
+        """
+        Agrega un registro a partir de un ejercicio realizado.
+        Args:
+            socio (str): Identificador del socio.
+            ejercicio (Ejercicio): Ejercicio completado.
+            fecha (datetime.date o None): Fecha de realización (por defecto, hoy).
+        """
+        self.agregar_filas([self.crear_fila(socio, ejercicio, fecha)])
+
+    def socios(self):
+        """
+        Returns:
+            list de str: Socios con al menos un registro, ordenados.
+        """
+        return sorted(set(self.columnas["socio"]))
@@ -0,0 +1,280 @@
+import datetime
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain, repeat
+from operator import add, itemgetter, mul, truediv
+
+VENTANA_AGUDA_DIAS = 7
+VENTANA_CRONICA_DIAS = 28
+RECUPERACION_MINIMA_DIAS = 2
+SESIONES_TENDENCIA = 4
+LIMITE_FATIGA = 1.3
+LIMITE_CAIDA_RENDIMIENTO = 0.95
+RANGO_REPETICIONES = (6, 12)
+INCREMENTO_PESO = 0.025
+INCREMENTO_MINIMO_KG = 2.5
+INCREMENTO_VELOCIDAD = 0.025
+INCREMENTO_INTERVALO_MIN = 0.25
+INTERVALO_OBJETIVO_MIN = 1.0
+FACTOR_DESCARGA = 0.9
+
+TIPOS_FUERZA = ("EjercicioFuerza", "EjercicioFuerzaDropSet")
+TIPOS_HIIT = ("EjercicioCardioHIIT",)
+
+
+def estimar_1rm(peso, repeticiones):
+    """
+    Estima la repetición máxima con la fórmula de Epley.
+    Args:
+        peso (float): Peso levantado en kg.
+        repeticiones (float): Repeticiones realizadas.
+    Returns:
+        float: 1RM estimado en kg.
+    """
+    return peso * (1 + repeticiones / 30)
+
+
+def _seleccionar(indices):
+    """Como itemgetter(*indices), pero siempre devuelve una tupla, incluso con un solo índice."""
+    if len(indices) == 1:
+        indice = indices[0]
+        return lambda secuencia: (secuencia[indice],)
+    return itemgetter(*indices)
+
+
+def _redondear(valor, paso):
+    """Redondea un valor al múltiplo más cercano de paso."""
+    return round(round(valor / paso) * paso, 2)
+
+
+class MotorProgresion:
+    """
+    Calcula la carga recomendada para la próxima sesión a partir del historial.
+    Los registros se agrupan por socio, ejercicio y tipo. Los grupos a calcular se
+    procesan juntos: la carga y el rendimiento de cada registro se calculan columna a
+    columna una sola vez, al incorporarlo, y las filas se toman ordenadas por (grupo,
+    fecha). Los bordes de cada grupo y de sus ventanas se ubican con bisect; solo cuentan
+    los registros hasta la fecha de cálculo, y cada grupo acumula sus cargas desde cero.
+    Cada resultado queda memorizado hasta que su grupo recibe registros nuevos o cambia
+    la fecha de cálculo.
+    Atributos:
+        historial (Historial): Historial sobre el que se calcula.
+    """
+
+    def __init__(self, historial):
+        """
+        Args:
+            historial (Historial): Historial sobre el que se calcula.
+        """
+        self.historial = historial
+        self._claves = []
+        self._ids = {}
+        self._filas_grupo = []
+        self._grupos_socio = {}
+        self._procesados = 0
+        self._memoria = {}
+        self._carga = array("d")
+        self._rendimiento = array("d")
+
+    def _actualizar_grupos(self):
+        """
+        Asigna a su grupo los registros agregados desde la última llamada y calcula,
+        columna a columna sobre esos registros, su carga y su rendimiento.
+        """
+        columnas = self.historial.columnas
+        inicio = self._procesados
+        pesos, repeticiones, sets = columnas["peso"][inicio:], columnas["repeticiones"][inicio:], columnas["sets"][inicio:]
+        regulares, intensas = columnas["velocidad_regular"][inicio:], columnas["velocidad_intensa"][inicio:]
+        tiempos = columnas["tiempo"][inicio:]
+        # Las columnas que no aplican a un tipo valen 0, así que cada fórmula combina ambos tipos:
+        # la carga es peso x repeticiones x sets o tiempo x velocidad media en km, y el rendimiento
+        # es el 1RM estimado (Epley) o la velocidad intensa.
+        self._carga.extend(map(
+            add,
+            map(mul, map(mul, pesos, repeticiones), sets),
+            map(mul, map(mul, tiempos, map(add, regulares, intensas)), repeat(1 / 120)),
+        ))
+        self._rendimiento.extend(map(
+            add,
+            map(mul, pesos, map(add, repeat(1.0), map(truediv, repeticiones, repeat(30.0)))),
+            intensas,
+        ))
+
+        claves = zip(columnas["socio"][inicio:], columnas["ejercicio"][inicio:], columnas["tipo"][inicio:])
+        for posicion, clave in enumerate(claves, inicio):
+            grupo = self._ids.get(clave)
+            if grupo is None:
+                if clave[2] in TIPOS_FUERZA or clave[2] in TIPOS_HIIT:
+                    grupo = len(self._claves)
+                    self._claves.append(clave)
+                    self._filas_grupo.append([])
+                    self._grupos_socio.setdefault(clave[0], []).append(grupo)
+                else:
+                    grupo = -1
+                self._ids[clave] = grupo
+            if grupo >= 0:
+                self._filas_grupo[grupo].append(posicion)
+        self._procesados = len(self.historial)
+
+    def recomendar(self, socio, fecha=None):
+        """
+        Recomienda la próxima carga de cada ejercicio de un socio.
+        Solo se calculan los grupos de ese socio.
+        Args:
+            socio (str): Identificador del socio.
+            fecha (datetime.date o None): Fecha de la próxima sesión (por defecto, hoy).
+        Returns:
+            list de dict: Una recomendación por ejercicio realizado hasta esa fecha.
+        """
+        self._actualizar_grupos()
+        grupos = self._grupos_socio.get(socio, [])
+        return self._resultados(grupos, (fecha or datetime.date.today()).toordinal())
+
+    def recomendar_todos(self, fecha=None):
+        """
+        Recomienda la próxima carga de cada ejercicio de todos los socios.
+        Args:
+            fecha (datetime.date o None): Fecha de la próxima sesión (por defecto, hoy).
+        Returns:
+            dict: Lista de recomendaciones por socio, solo de los socios con registros hasta esa fecha.
+        """
+        self._actualizar_grupos()
+        hoy = (fecha or datetime.date.today()).toordinal()
+        self._resultados(range(len(self._claves)), hoy)
+        todos = {}
+        for socio, grupos in self._grupos_socio.items():
+            recomendaciones = [self._memoria[g][2] for g in grupos if self._memoria[g][2] is not None]
+            if recomendaciones:
+                todos[socio] = recomendaciones
+        return todos
+
+    def _resultados(self, grupos, hoy):
+        """
+        Devuelve el resultado de cada grupo, calculando en bloque los que estén desactualizados.
+        Args:
+            grupos (iterable de int): Grupos pedidos.
+            hoy (int): Fecha de cálculo como ordinal.
+        Returns:
+            list de dict: Resultado de cada grupo con registros hasta esa fecha, en el mismo orden.
+        """
+        grupos = list(grupos)
+        pendientes = [
+            g for g in grupos
+            if self._memoria.get(g, (None, None))[:2] != (len(self._filas_grupo[g]), hoy)
+        ]
+        if pendientes:
+            for grupo, resultado in zip(pendientes, self._calcular(pendientes, hoy)):
+                self._memoria[grupo] = (len(self._filas_grupo[grupo]), hoy, resultado)
+        return [self._memoria[g][2] for g in grupos if self._memoria[g][2] is not None]
+
+    def _calcular(self, grupos, hoy):
+        """
+        Calcula en bloque las recomendaciones de varios grupos.
+        Args:
+            grupos (list de int): Grupos a calcular.
+            hoy (int): Fecha de cálculo como ordinal.
+        Returns:
+            list de dict o None: Recomendación de cada grupo en el mismo orden,
+            o None si el grupo no tiene registros hasta esa fecha.
+        """
+        columnas = self.historial.columnas
+        # Cada grupo se mantiene ordenado por fecha (casi siempre ya lo está), así que al
+        # concatenarlos las filas quedan ordenadas por (grupo, fecha).
+        for grupo in grupos:
+            self._filas_grupo[grupo].sort(key=columnas["fecha"].__getitem__)
+        filas = list(chain.from_iterable(self._filas_grupo[g] for g in grupos))
+        bordes = list(accumulate((len(self._filas_grupo[g]) for g in grupos), initial=0))
+        tomar = _seleccionar(filas)
+        fechas, cargas, rendimiento = tomar(columnas["fecha"]), tomar(self._carga), tomar(self._rendimiento)
+        semanas_cronicas = VENTANA_CRONICA_DIAS / VENTANA_AGUDA_DIAS
+
+        resultados = []
+        for grupo, inicio, fin in zip(grupos, bordes, bordes[1:]):
+            # Las sesiones posteriores a la fecha de cálculo no cuentan.
+            fin = bisect_right(fechas, hoy, inicio, fin)
+            if fin == inicio:
+                resultados.append(None)
+                continue
+            acumulado = list(accumulate(cargas[inicio:fin], initial=0))
+            agudo = bisect_right(fechas, hoy - VENTANA_AGUDA_DIAS, inicio, fin) - inicio
+            cronico = bisect_right(fechas, hoy - VENTANA_CRONICA_DIAS, inicio, fin) - inicio
+            volumen_agudo = acumulado[-1] - acumulado[agudo]
+            volumen_cronico = acumulado[-1] - acumulado[cronico]
+            historia_suficiente = fechas[inicio] <= hoy - VENTANA_CRONICA_DIAS
+            acwr = (
+                volumen_agudo / (volumen_cronico / semanas_cronicas)
+                if historia_suficiente and volumen_cronico else None
+            )
+
+            ventana = min(SESIONES_TENDENCIA, fin - inicio)
+            promedio = sum(rendimiento[fin - ventana:fin]) / ventana
+            ultimo = fin - 1
+            tendencia = rendimiento[ultimo] / promedio if promedio else 1.0
+            dias_desde_ultima = int(hoy - fechas[ultimo])
+
+            if acwr is not None and acwr > LIMITE_FATIGA:
+                estado = "descarga"
+            elif dias_desde_ultima < RECUPERACION_MINIMA_DIAS or tendencia < LIMITE_CAIDA_RENDIMIENTO:
+                estado = "mantener"
+            else:
+                estado = "progresar"
+
+            fila = filas[ultimo]
+            socio, ejercicio, tipo = self._claves[grupo]
+            recomendacion = {
+                "socio": socio,
+                "ejercicio": ejercicio,
+                "tipo": tipo,
+                "estado": estado,
+                "sesiones": fin - inicio,
+                "volumen_semanal": volumen_agudo,
+                "acwr": acwr,
+                "dias_desde_ultima": dias_desde_ultima,
+            }
+            if tipo in TIPOS_FUERZA:
+                recomendacion["1rm_estimado"] = rendimiento[ultimo]
+                recomendacion.update(self._siguiente_fuerza(
+                    columnas["peso"][fila], columnas["repeticiones"][fila], estado
+                ))
+            else:
+                recomendacion.update(self._siguiente_hiit(
+                    columnas["velocidad_intensa"][fila], columnas["intervalo"][fila], columnas["tiempo"][fila], estado
+                ))
+            resultados.append(recomendacion)
+        return resultados
+
+    @staticmethod
+    def _siguiente_fuerza(peso, repeticiones, estado):
+        """
+        Doble progresión: primero sube repeticiones hasta el máximo del rango
+        y luego sube el peso volviendo al mínimo del rango.
+        Returns:
+            dict: Peso y repeticiones sugeridos.
+        """
+        minimo, maximo = RANGO_REPETICIONES
+        if estado == "descarga":
+            return {"peso": _redondear(peso * FACTOR_DESCARGA, INCREMENTO_MINIMO_KG), "repeticiones": int(repeticiones)}
+        if estado == "mantener":
+            return {"peso": peso, "repeticiones": int(repeticiones)}
+        if repeticiones < maximo:
+            return {"peso": peso, "repeticiones": int(max(repeticiones + 1, minimo))}
+        incremento = max(peso * INCREMENTO_PESO, INCREMENTO_MINIMO_KG)
+        return {"peso": _redondear(peso + incremento, INCREMENTO_MINIMO_KG), "repeticiones": minimo}
+
+    @staticmethod
+    def _siguiente_hiit(velocidad_intensa, intervalo, tiempo, estado):
+        """
+        Primero alarga el intervalo hasta el objetivo y luego sube la velocidad intensa.
+        Returns:
+            dict: Velocidad intensa e intervalo sugeridos.
+        """
+        if estado == "descarga":
+            return {"velocidad_intensa": _redondear(velocidad_intensa * FACTOR_DESCARGA, 0.1), "intervalo": intervalo}
+        if estado == "mantener":
+            return {"velocidad_intensa": velocidad_intensa, "intervalo": intervalo}
+        if intervalo < INTERVALO_OBJETIVO_MIN and intervalo + INCREMENTO_INTERVALO_MIN <= tiempo / 2:
+            return {"velocidad_intensa": velocidad_intensa, "intervalo": intervalo + INCREMENTO_INTERVALO_MIN}
+        return {
+            "velocidad_intensa": _redondear(velocidad_intensa * (1 + INCREMENTO_VELOCIDAD), 0.1),
+            "intervalo": intervalo,
+        }
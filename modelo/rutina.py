@@ -1,3 +1,5 @@
+from instrumentacion.metricas import medido
+
 class Rutina:
     """
     Representa una rutina de ejercicios.
@@ -31,3 +33,24 @@ class Rutina:
             list de str: Lista con las descripciones numeradas de los ejercicios.
         """
         return [f"{i + 1}. {e.descripcion()}" for i, e in enumerate(self.ejercicios)]
+
+    @medido("modelo.Rutina.estimar_calorias")
+    def estimar_calorias(self):
+        """
+        Estima las calorías totales de la rutina sumando las de cada ejercicio.
+        Returns:
+            float: Calorías estimadas de la rutina.
+        """
+        return sum(e.estimar_calorias() for e in self.ejercicios)
+
+    def a_diccionario(self):
+        """
+        Devuelve una representación serializable de la rutina y sus ejercicios.
+        Returns:
+            dict: Datos de la rutina.
+        """
+        return {
+            "nombre": self.nombre,
+            "ejercicios": [e.a_diccionario() for e in self.ejercicios],
+            "calorias": self.estimar_calorias(),
+        }
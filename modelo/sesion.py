@@ -0,0 +1,95 @@
+class SesionRutina:
+    """
+    Representa la ejecución paso a paso de una rutina.
+    Cada paso es un set de un ejercicio o un descanso entre sets,
+    en el mismo orden en que el controlador realiza la rutina.
+    Atributos:
+        rutina (Rutina): Rutina que se está realizando.
+        socio (str o None): Identificador del socio que realiza la rutina.
+        pasos (list): Lista de pasos de la sesión.
+        indice (int): Posición del paso actual.
+    """
+
+    def __init__(self, rutina, socio=None):
+        """
+        Inicializa una sesión a partir de una rutina.
+        Args:
+            rutina (Rutina): Rutina a realizar.
+            socio (str o None): Identificador del socio que realiza la rutina.
+        """
+        self.rutina = rutina
+        self.socio = socio
+        self.pasos = self._generar_pasos(rutina)
+        self.indice = 0
+
+    @staticmethod
+    def _generar_pasos(rutina):
+        """
+        Genera la lista de pasos de una rutina.
+        Args:
+            rutina (Rutina): Rutina a recorrer.
+        Returns:
+            list de dict: Pasos de tipo "ejercicio" o "descanso".
+        """
+        pasos = []
+        for ejercicio in rutina.ejercicios:
+            sets = int(getattr(ejercicio, 'sets', 1))
+
+            for numero_set in range(1, sets + 1):
+                pasos.append({"tipo": "ejercicio", "ejercicio": ejercicio, "numero_set": numero_set})
+
+                descanso = getattr(ejercicio, 'descanso', None)
+                if isinstance(descanso, (int, float)) and descanso > 0 and numero_set < sets:
+                    pasos.append({"tipo": "descanso", "minutos": descanso})
+        return pasos
+
+    @property
+    def finalizada(self):
+        """
+        Indica si ya se recorrieron todos los pasos.
+        Returns:
+            bool: True si la sesión terminó.
+        """
+        return self.indice >= len(self.pasos)
+
+    def paso_actual(self):
+        """
+        Devuelve el paso actual de la sesión.
+        Returns:
+            dict o None: Paso actual, o None si la sesión terminó.
+        """
+        if self.finalizada:
+            return None
+        return self.pasos[self.indice]
+
+    def avanzar(self):
+        """
+        Avanza al siguiente paso de la sesión.
+        Returns:
+            dict o None: Nuevo paso actual, o None si la sesión terminó.
+        """
+        if not self.finalizada:
+            self.indice += 1
+        return self.paso_actual()
+
+    def a_diccionario(self):
+        """
+        Devuelve una representación serializable del estado de la sesión.
+        Returns:
+            dict: Estado de la sesión.
+        """
+        paso = self.paso_actual()
+        if paso is not None and paso["tipo"] == "ejercicio":
+            paso = {
+                "tipo": "ejercicio",
+                "numero_set": paso["numero_set"],
+                "ejercicio": paso["ejercicio"].a_diccionario(),
+            }
+        return {
+            "rutina": self.rutina.nombre,
+            "socio": self.socio,
+            "paso": self.indice + 1 if not self.finalizada else len(self.pasos),
+            "total_pasos": len(self.pasos),
+            "paso_actual": paso,
+            "finalizada": self.finalizada,
+        }
@@ -0,0 +1,27 @@
+import argparse
+import asyncio
+from instrumentacion.metricas import REGISTRO
+from vista.vista_api import VistaAPI
+from controlador.controlador import Controlador
+from servidor.servidor_api import ServidorAPI
+
+
+async def main(host, puerto):
+    servidor = ServidorAPI(Controlador(VistaAPI()))
+    puerto = await servidor.iniciar(host, puerto)
+    print(f"Servidor MyGymBro escuchando en http://{host}:{puerto}")
+    await servidor.servir_siempre()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON local de MyGymBro.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--metricas", action="store_true", help="Registrar métricas y exponerlas en /metricas.")
+    args = parser.parse_args()
+    if args.metricas:
+        REGISTRO.activar()
+    try:
+        asyncio.run(main(args.host, args.puerto))
+    except KeyboardInterrupt:
+        pass
@@ -1,7 +1,29 @@
+import argparse
+from instrumentacion.metricas import REGISTRO
+from instrumentacion.perfilado import PerfiladorSesion
 from vista.vista import VistaCLI
 from controlador.controlador import Controlador
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MyGymBro con interfaz orientada a texto.")
+    parser.add_argument("--metricas", metavar="ARCHIVO",
+                        help="Registrar métricas y volcarlas al salir (.prom/.txt para Prometheus, JSON en otro caso).")
+    parser.add_argument("--perfil", metavar="DIRECTORIO",
+                        help="Perfilar la sesión completa con cProfile y tracemalloc.")
+    args = parser.parse_args()
+
+    if args.metricas:
+        REGISTRO.activar()
+    perfilador = PerfiladorSesion(args.perfil) if args.perfil else None
+    if perfilador:
+        perfilador.iniciar()
+
     vista = VistaCLI()
     controlador = Controlador(vista)
-    controlador.iniciar()
+    try:
+        controlador.iniciar()
+    finally:
+        if perfilador:
+            perfilador.detener()
+        if args.metricas:
+            REGISTRO.volcar(args.metricas)
@@ -0,0 +1,27 @@
+import argparse
+import datetime
+import json
+import os
+from vista.vista_api import VistaAPI
+from controlador.controlador import Controlador
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcula las cargas sugeridas de la próxima sesión de todos los socios.")
+    parser.add_argument("--fecha", type=datetime.date.fromisoformat,
+                        default=datetime.date.today() + datetime.timedelta(days=1),
+                        help="Fecha de la próxima sesión (AAAA-MM-DD). Por defecto, mañana: "
+                             "el cálculo nocturno prepara la sesión del día siguiente.")
+    parser.add_argument("--salida", default=os.path.join("datos", "recomendaciones.json"))
+    args = parser.parse_args()
+
+    vista = VistaAPI()
+    controlador = Controlador(vista)
+    controlador.cargar_historial()
+    recomendaciones = controlador.recomendar_progresion(fecha=args.fecha)
+    for mensaje in vista.obtener_mensajes():
+        print(mensaje)
+
+    os.makedirs(os.path.dirname(args.salida) or ".", exist_ok=True)
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(recomendaciones, f, indent=2, ensure_ascii=False)
+    print(f"Recomendaciones de {len(recomendaciones)} socio/s escritas en {args.salida}")
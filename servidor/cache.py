@@ -0,0 +1,100 @@
+import hashlib
+import json
+
+
+class RespuestaCacheada:
+    """
+    Respuesta HTTP ya serializada y lista para enviarse.
+    Atributos:
+        cuerpo (bytes): Cuerpo codificado en UTF-8.
+        etag (str): Etag fuerte calculado a partir del cuerpo.
+        tipo_contenido (str): Valor de la cabecera Content-Type.
+    """
+
+    def __init__(self, cuerpo, tipo_contenido="application/json; charset=utf-8"):
+        """
+        Inicializa la respuesta y calcula su etag.
+        Args:
+            cuerpo (bytes): Cuerpo codificado.
+            tipo_contenido (str): Valor de la cabecera Content-Type.
+        """
+        self.cuerpo = cuerpo
+        self.tipo_contenido = tipo_contenido
+        self.etag = '"' + hashlib.sha1(cuerpo).hexdigest() + '"'
+
+    @classmethod
+    def desde_datos(cls, datos):
+        """
+        Serializa datos a JSON y construye la respuesta.
+        Los valores no finitos (NaN, Infinity) no son JSON válido y se rechazan.
+        Args:
+            datos: Objeto serializable a JSON.
+        Returns:
+            RespuestaCacheada: Respuesta con cuerpo y etag.
+        Raises:
+            ValueError: Si los datos contienen un float no finito.
+        """
+        return cls(json.dumps(datos, ensure_ascii=False, allow_nan=False).encode("utf-8"))
+
+    def coincide(self, if_none_match):
+        """
+        Indica si el valor de la cabecera If-None-Match coincide con el etag.
+        Args:
+            if_none_match (str o None): Valor recibido en la petición.
+        Returns:
+            bool: True si el cliente ya tiene esta versión.
+        """
+        if not if_none_match:
+            return False
+        etags = [e.strip() for e in if_none_match.split(",")]
+        return "*" in etags or self.etag in etags or "W/" + self.etag in etags
+
+
+class CacheRespuestas:
+    """
+    Cache en memoria de respuestas de lectura.
+    Las entradas se asocian a una versión de las rutinas; cuando la versión
+    cambia, la cache se vacía por completo.
+    Atributos:
+        version (int): Versión de las rutinas con la que se generaron las entradas.
+        aciertos (int): Cantidad de lecturas servidas desde la cache.
+        fallos (int): Cantidad de lecturas que tuvieron que generarse.
+    """
+
+    def __init__(self):
+        """Inicializa una cache vacía."""
+        self.version = None
+        self._entradas = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave, version, generar):
+        """
+        Devuelve la respuesta cacheada para una clave, generándola si hace falta.
+        Args:
+            clave (str): Identificador de la respuesta (por ejemplo, la ruta).
+            version (int): Versión actual de las rutinas.
+            generar (callable): Función sin argumentos que devuelve los datos a serializar.
+        Returns:
+            RespuestaCacheada: Respuesta para la clave.
+        """
+        if version != self.version:
+            self.invalidar()
+            self.version = version
+
+        respuesta = self._entradas.get(clave)
+        if respuesta is not None:
+            self.aciertos += 1
+            return respuesta
+
+        self.fallos += 1
+        respuesta = RespuestaCacheada.desde_datos(generar())
+        self._entradas[clave] = respuesta
+        return respuesta
+
+    def invalidar(self):
+        """Elimina todas las entradas de la cache."""
+        self._entradas.clear()
+
+    def __len__(self):
+        return len(self._entradas)
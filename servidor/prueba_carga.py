@@ -0,0 +1,159 @@
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from vista.vista_api import VistaAPI
+from controlador.controlador import Controlador
+from modelo.rutina import Rutina
+from modelo.ejercicio_fuerza import EjercicioFuerza, EjercicioFuerzaDropSet
+from modelo.ejercicio_cardio import EjercicioCardio, EjercicioCardioHIIT
+from servidor.servidor_api import ServidorAPI
+
+
+def percentil(valores_ordenados, p):
+    """
+    Calcula un percentil por rango más cercano.
+    Args:
+        valores_ordenados (list de float): Valores ordenados de menor a mayor.
+        p (float): Percentil entre 0 y 100.
+    Returns:
+        float: Valor del percentil, o 0 si no hay valores.
+    """
+    if not valores_ordenados:
+        return 0.0
+    indice = max(0, min(len(valores_ordenados) - 1, round(p / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+async def _peticion(reader, writer, host, ruta, etag=None):
+    """
+    Envía un GET por una conexión abierta y lee la respuesta completa.
+    Returns:
+        tuple: (código de estado, etag de la respuesta).
+    """
+    cabeceras = f"GET {ruta} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n"
+    if etag:
+        cabeceras += f"If-None-Match: {etag}\r\n"
+    writer.write((cabeceras + "\r\n").encode("latin-1"))
+    await writer.drain()
+
+    estado = int((await reader.readline()).split()[1])
+    largo = 0
+    etag_respuesta = None
+    while True:
+        linea = await reader.readline()
+        if linea in (b"\r\n", b""):
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        nombre = nombre.strip().lower()
+        if nombre == "content-length":
+            largo = int(valor)
+        elif nombre == "etag":
+            etag_respuesta = valor.strip()
+    if largo:
+        await reader.readexactly(largo)
+    return estado, etag_respuesta
+
+
+async def _cliente(host, puerto, rutas, peticiones, usar_etag, latencias, errores):
+    """Ejecuta una secuencia de peticiones por una única conexión keep-alive."""
+    reader, writer = await asyncio.open_connection(host, puerto)
+    etags = {}
+    try:
+        for i in range(peticiones):
+            ruta = rutas[i % len(rutas)]
+            inicio = time.perf_counter()
+            estado, etag = await _peticion(reader, writer, host, ruta, etags.get(ruta) if usar_etag else None)
+            latencias.append(time.perf_counter() - inicio)
+            if estado >= 400:
+                errores.append(estado)
+            if etag:
+                etags[ruta] = etag
+    finally:
+        writer.close()
+
+
+async def ejecutar_prueba(host, puerto, rutas, conexiones, peticiones, usar_etag):
+    """
+    Lanza varios clientes concurrentes y resume las latencias observadas.
+    Args:
+        host (str): Host del servidor.
+        puerto (int): Puerto del servidor.
+        rutas (list de str): Rutas a consultar de forma rotativa.
+        conexiones (int): Cantidad de clientes concurrentes.
+        peticiones (int): Peticiones por cliente.
+        usar_etag (bool): Si los clientes reenvían el etag con If-None-Match.
+    Returns:
+        dict: Total de peticiones, errores, p50/p99 en milisegundos y peticiones por segundo.
+    """
+    latencias = []
+    errores = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        _cliente(host, puerto, rutas, peticiones, usar_etag, latencias, errores)
+        for _ in range(conexiones)
+    ))
+    duracion = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        "peticiones": len(latencias),
+        "errores": len(errores),
+        "p50_ms": percentil(latencias, 50) * 1000,
+        "p99_ms": percentil(latencias, 99) * 1000,
+        "peticiones_por_segundo": len(latencias) / duracion if duracion else 0.0,
+    }
+
+
+def _rutinas_de_ejemplo(cantidad):
+    """Crea rutinas con una mezcla de los cuatro tipos de ejercicio."""
+    rutinas = []
+    for i in range(cantidad):
+        rutina = Rutina(f"Rutina {i + 1}")
+        rutina.agregar_ejercicio(EjercicioFuerza("Press banca", 60, 10, 4, 2))
+        rutina.agregar_ejercicio(EjercicioFuerzaDropSet("Curl", 20, 8, 1, 3, 2.5, 2))
+        rutina.agregar_ejercicio(EjercicioCardio("Trote", 8, 20))
+        rutina.agregar_ejercicio(EjercicioCardioHIIT("Sprints", 8, 14, 1, 10))
+        rutinas.append(rutina)
+    return rutinas
+
+
+async def _main(args):
+    servidor = None
+    directorio = None
+    host, puerto = args.host, args.puerto
+    rutas = args.ruta or ["/rutinas", "/rutinas/1", "/rutinas/1/calorias", "/rutinas/1/ejercicios/1"]
+    try:
+        if puerto is None:
+            directorio = tempfile.mkdtemp(prefix="mygymbro_")
+            controlador = Controlador(VistaAPI())
+            controlador.ARCHIVO_RUTINAS = os.path.join(directorio, "rutinas.pkl")
+            controlador.ARCHIVO_HISTORIAL = os.path.join(directorio, "historial.pkl")
+            controlador.rutinas = _rutinas_de_ejemplo(args.rutinas)
+            controlador.guardar_rutinas()
+            servidor = ServidorAPI(controlador)
+            puerto = await servidor.iniciar(host, 0)
+        resultado = await ejecutar_prueba(host, puerto, rutas, args.conexiones, args.peticiones, args.etag)
+    finally:
+        if servidor is not None:
+            await servidor.detener()
+        if directorio is not None:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+    print(f"Peticiones: {resultado['peticiones']}  Errores: {resultado['errores']}")
+    print(f"p50: {resultado['p50_ms']:.3f} ms  p99: {resultado['p99_ms']:.3f} ms")
+    print(f"Peticiones/s: {resultado['peticiones_por_segundo']:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga local del servicio HTTP de MyGymBro.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=None,
+                        help="Puerto de un servidor ya iniciado. Si se omite, se levanta uno temporal.")
+    parser.add_argument("--conexiones", type=int, default=20)
+    parser.add_argument("--peticiones", type=int, default=500, help="Peticiones por conexión.")
+    parser.add_argument("--rutinas", type=int, default=50, help="Rutinas del servidor temporal.")
+    parser.add_argument("--ruta", action="append", help="Ruta a consultar (se puede repetir).")
+    parser.add_argument("--etag", action="store_true", help="Reenviar el ETag con If-None-Match.")
+    asyncio.run(_main(parser.parse_args()))
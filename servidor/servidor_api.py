@@ -0,0 +1,495 @@
+import asyncio
+import itertools
+import json
+import math
+import os
+from http import HTTPStatus
+from instrumentacion.metricas import REGISTRO
+from modelo.rutina import Rutina
+from modelo.ejercicio_fuerza import EjercicioFuerza, EjercicioFuerzaDropSet
+from modelo.ejercicio_cardio import EjercicioCardio, EjercicioCardioHIIT
+from servidor.cache import CacheRespuestas, RespuestaCacheada
+
+TIPOS_EJERCICIO = {
+    clase.__name__: clase
+    for clase in (EjercicioFuerza, EjercicioFuerzaDropSet, EjercicioCardio, EjercicioCardioHIIT)
+}
+
+TAMANO_MAXIMO_CUERPO = 1024 * 1024
+
+# Campos que la vista CLI pide con pedir_int; el resto de los numéricos se piden con pedir_float.
+CAMPOS_ENTEROS = ("repeticiones", "sets", "variacion_repeticiones")
+
+# Máximo aceptado para cada campo numérico (kg, repeticiones, series, minutos y km/h).
+# Acotan el trabajo por serie de estimar_calorias y de las sesiones.
+MAXIMOS_CAMPOS = {
+    "peso_maximo": 1000,
+    "variacion_peso": 1000,
+    "repeticiones": 1000,
+    "variacion_repeticiones": 1000,
+    "sets": 100,
+    "descanso": 60,
+    "intervalo": 600,
+    "tiempo": 600,
+    "velocidad_regular": 100,
+    "velocidad_intensa": 100,
+}
+
+
+class ErrorHTTP(Exception):
+    """Error que se traduce directamente en una respuesta HTTP."""
+
+    def __init__(self, estado, mensaje):
+        """
+        Args:
+            estado (HTTPStatus): Código de estado de la respuesta.
+            mensaje (str): Descripción del error.
+        """
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+
+class ServidorAPI:
+    """
+    Servicio HTTP/JSON local basado en asyncio que expone las rutinas a través del controlador.
+    Las lecturas se sirven desde una cache en memoria con soporte de ETag/If-None-Match,
+    que se invalida cuando cambia la versión de las rutinas del controlador.
+    Las lecturas y escrituras de archivos se hacen en un hilo aparte (asyncio.to_thread)
+    para no bloquear el bucle de eventos, de a una por archivo.
+    Atributos:
+        controlador (Controlador): Controlador con una vista no bloqueante.
+        cache (CacheRespuestas): Cache de respuestas de lectura.
+        sesiones (dict): Sesiones de rutina activas indexadas por id.
+    """
+
+    def __init__(self, controlador):
+        """
+        Inicializa el servidor sobre un controlador ya creado.
+        Args:
+            controlador (Controlador): Controlador cuyas rutinas se exponen.
+        """
+        self.controlador = controlador
+        self.cache = CacheRespuestas()
+        self.sesiones = {}
+        self._ids_sesion = itertools.count(1)
+        self._mtime_archivo = None
+        self._mtime_historial = None
+        self._bloqueo_rutinas = asyncio.Lock()
+        self._bloqueo_historial = asyncio.Lock()
+        self._servidor = None
+
+    async def iniciar(self, host="127.0.0.1", puerto=8080):
+        """
+        Carga las rutinas y comienza a aceptar conexiones.
+        Args:
+            host (str): Dirección en la que escuchar.
+            puerto (int): Puerto en el que escuchar (0 elige uno libre).
+        Returns:
+            int: Puerto efectivo en el que escucha el servidor.
+        """
+        await self._sincronizar()
+        async with self._bloqueo_historial:
+            await self._sincronizar_historial()
+        self._servidor = await asyncio.start_server(self._atender_conexion, host, puerto)
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def servir_siempre(self):
+        """Atiende conexiones hasta que se cancele la tarea."""
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def detener(self):
+        """Deja de aceptar conexiones y espera al cierre del socket."""
+        self._servidor.close()
+        await self._servidor.wait_closed()
+
+    @staticmethod
+    def _mtime(ruta):
+        """Devuelve la fecha de modificación de un archivo en nanosegundos, o None si no existe."""
+        try:
+            return os.stat(ruta).st_mtime_ns
+        except OSError:
+            return None
+
+    async def _sincronizar(self):
+        """
+        Recarga las rutinas si el archivo fue modificado por otro proceso,
+        por ejemplo otro kiosco que comparte la carpeta de datos.
+        Mientras el propio servidor está guardando, las rutinas en memoria ya están al día.
+        """
+        if self._bloqueo_rutinas.locked():
+            return
+        async with self._bloqueo_rutinas:
+            mtime = self._mtime(self.controlador.ARCHIVO_RUTINAS)
+            if mtime != self._mtime_archivo:
+                self._mtime_archivo = mtime
+                await asyncio.to_thread(self.controlador.cargar_rutinas)
+
+    async def _agregar_rutina(self, rutina):
+        """
+        Agrega y guarda una rutina sin bloquear el bucle de eventos.
+        Registra la fecha de modificación del guardado para no recargar el archivo recién escrito.
+        Args:
+            rutina (Rutina): Rutina a agregar.
+        """
+        async with self._bloqueo_rutinas:
+            await asyncio.to_thread(self.controlador.agregar_rutina, rutina)
+            self._mtime_archivo = self._mtime(self.controlador.ARCHIVO_RUTINAS)
+
+    async def _sincronizar_historial(self):
+        """
+        Lee las sesiones que otros procesos agregaron al historial desde la última lectura.
+        Debe llamarse con _bloqueo_historial tomado.
+        """
+        mtime = self._mtime(self.controlador.ARCHIVO_HISTORIAL)
+        if mtime != self._mtime_historial:
+            self._mtime_historial = mtime
+            await asyncio.to_thread(self.controlador.cargar_historial)
+
+    async def _atender_conexion(self, reader, writer):
+        """
+        Atiende las peticiones de una conexión manteniéndola abierta (keep-alive).
+        Args:
+            reader (asyncio.StreamReader): Flujo de lectura del cliente.
+            writer (asyncio.StreamWriter): Flujo de escritura al cliente.
+        """
+        try:
+            while True:
+                try:
+                    peticion = await self._leer_peticion(reader)
+                except ErrorHTTP as e:
+                    respuesta = RespuestaCacheada.desde_datos({"error": e.mensaje})
+                    self._escribir_respuesta(writer, e.estado, respuesta, {}, False)
+                    await writer.drain()
+                    break
+                if peticion is None:
+                    break
+                metodo, ruta, cabeceras, cuerpo = peticion
+                with REGISTRO.tramo("servidor.peticion"):
+                    estado, respuesta, extra = await self._despachar(metodo, ruta, cabeceras, cuerpo)
+                mantener = cabeceras.get("connection", "").lower() != "close"
+                self._escribir_respuesta(writer, estado, respuesta, extra, mantener)
+                await writer.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _leer_peticion(self, reader):
+        """
+        Lee una petición HTTP/1.1 completa.
+        Args:
+            reader (asyncio.StreamReader): Flujo de lectura del cliente.
+        Returns:
+            tuple o None: (método, ruta, cabeceras, cuerpo), o None si el cliente cerró la conexión.
+        Raises:
+            ErrorHTTP: Si la petición está mal formada o alguna de sus partes es demasiado grande.
+        """
+        linea = await self._leer_linea(reader, HTTPStatus.BAD_REQUEST, "La línea de petición es demasiado larga.")
+        if not linea:
+            return None
+        try:
+            metodo, ruta, _ = linea.decode("latin-1").split()
+        except ValueError:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Línea de petición inválida.")
+
+        cabeceras = {}
+        while True:
+            linea = await self._leer_linea(
+                reader, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Una cabecera es demasiado larga."
+            )
+            if linea in (b"\r\n", b"\n", b""):
+                break
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            cabeceras[nombre.strip().lower()] = valor.strip()
+
+        valor = cabeceras.get("content-length", "0") or "0"
+        if not valor.isdigit():
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Content-Length inválido: {valor}")
+        largo = int(valor)
+        if largo > TAMANO_MAXIMO_CUERPO:
+            raise ErrorHTTP(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"El cuerpo supera el máximo de {TAMANO_MAXIMO_CUERPO} bytes."
+            )
+        cuerpo = await reader.readexactly(largo) if largo else b""
+        return metodo.upper(), ruta.split("?", 1)[0], cabeceras, cuerpo
+
+    @staticmethod
+    async def _leer_linea(reader, estado, mensaje):
+        """
+        Lee una línea de la petición.
+        Args:
+            reader (asyncio.StreamReader): Flujo de lectura del cliente.
+            estado (HTTPStatus): Código a responder si la línea supera el límite del flujo.
+            mensaje (str): Descripción del error en ese caso.
+        Returns:
+            bytes: Línea leída, vacía si el cliente cerró la conexión.
+        Raises:
+            ErrorHTTP: Si la línea supera el límite del flujo (64 KiB por defecto).
+        """
+        try:
+            return await reader.readline()
+        except ValueError:
+            raise ErrorHTTP(estado, mensaje)
+
+    def _escribir_respuesta(self, writer, estado, respuesta, extra, mantener):
+        """
+        Serializa y escribe una respuesta HTTP.
+        Args:
+            writer (asyncio.StreamWriter): Flujo de escritura al cliente.
+            estado (HTTPStatus): Código de estado.
+            respuesta (RespuestaCacheada o None): Cuerpo y etag de la respuesta.
+            extra (dict): Cabeceras adicionales.
+            mantener (bool): Si la conexión se mantiene abierta.
+        """
+        cuerpo = respuesta.cuerpo if respuesta is not None and estado != HTTPStatus.NOT_MODIFIED else b""
+        lineas = [f"HTTP/1.1 {estado.value} {estado.phrase}"]
+        if respuesta is not None:
+            lineas.append(f"ETag: {respuesta.etag}")
+        if cuerpo:
+            lineas.append(f"Content-Type: {respuesta.tipo_contenido}")
+        lineas.append(f"Content-Length: {len(cuerpo)}")
+        lineas.append("Connection: " + ("keep-alive" if mantener else "close"))
+        for nombre, valor in extra.items():
+            lineas.append(f"{nombre}: {valor}")
+        writer.write(("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1") + cuerpo)
+
+    async def _despachar(self, metodo, ruta, cabeceras, cuerpo):
+        """
+        Resuelve una petición y arma su respuesta.
+        Args:
+            metodo (str): Método HTTP.
+            ruta (str): Ruta solicitada, sin parámetros de consulta.
+            cabeceras (dict): Cabeceras en minúsculas.
+            cuerpo (bytes): Cuerpo de la petición.
+        Returns:
+            tuple: (estado, RespuestaCacheada, cabeceras adicionales).
+        """
+        partes = [p for p in ruta.split("/") if p]
+        try:
+            if metodo == "GET" and partes and partes[0] == "rutinas":
+                await self._sincronizar()
+                respuesta = self.cache.obtener(
+                    "/" + "/".join(partes), self.controlador.version, lambda: self._leer_rutinas(partes[1:])
+                )
+                if respuesta.coincide(cabeceras.get("if-none-match")):
+                    return HTTPStatus.NOT_MODIFIED, respuesta, {"Cache-Control": "no-cache"}
+                return HTTPStatus.OK, respuesta, {"Cache-Control": "no-cache"}
+
+            if metodo == "POST" and partes == ["rutinas"]:
+                rutina = self._crear_rutina(self._leer_json(cuerpo))
+                datos = rutina.a_diccionario()
+                await self._sincronizar()
+                await self._agregar_rutina(rutina)
+                datos["id"] = len(self.controlador.rutinas)
+                datos["mensajes"] = self.controlador.vista.obtener_mensajes()
+                return HTTPStatus.CREATED, RespuestaCacheada.desde_datos(datos), {}
+
+            if metodo == "GET" and partes == ["metricas"]:
+                return HTTPStatus.OK, RespuestaCacheada(
+                    REGISTRO.a_prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+                ), {}
+
+            if metodo == "GET" and partes == ["metricas.json"]:
+                return HTTPStatus.OK, RespuestaCacheada(REGISTRO.a_json().encode("utf-8")), {}
+
+            if metodo == "GET" and len(partes) == 3 and partes[0] == "socios" and partes[2] == "recomendaciones":
+                async with self._bloqueo_historial:
+                    await self._sincronizar_historial()
+                    recomendaciones = self.controlador.recomendar_progresion(partes[1])
+                datos = {"socio": partes[1], "recomendaciones": recomendaciones}
+                return HTTPStatus.OK, RespuestaCacheada.desde_datos(datos), {}
+
+            if partes and partes[0] == "sesiones":
+                return await self._despachar_sesion(metodo, partes[1:], cuerpo)
+
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {metodo} {ruta}")
+        except ErrorHTTP as e:
+            return e.estado, RespuestaCacheada.desde_datos({"error": e.mensaje}), {}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, RespuestaCacheada.desde_datos({"error": f"Error interno: {e}"}), {}
+
+    async def _despachar_sesion(self, metodo, partes, cuerpo):
+        """
+        Resuelve las operaciones sobre sesiones de rutina.
+        Args:
+            metodo (str): Método HTTP.
+            partes (list de str): Segmentos de la ruta después de "sesiones".
+            cuerpo (bytes): Cuerpo de la petición.
+        Returns:
+            tuple: (estado, RespuestaCacheada, cabeceras adicionales).
+        """
+        if metodo == "POST" and not partes:
+            datos = self._leer_json(cuerpo)
+            rutina = self._obtener_rutina(datos.get("rutina"))
+            id_sesion = next(self._ids_sesion)
+            sesion = self.controlador.iniciar_sesion(rutina, datos.get("socio"))
+            self.sesiones[id_sesion] = sesion
+            return HTTPStatus.CREATED, self._respuesta_sesion(id_sesion, sesion), {}
+
+        if not partes:
+            raise ErrorHTTP(HTTPStatus.METHOD_NOT_ALLOWED, "Método no permitido.")
+        id_sesion = self._indice(partes[0])
+        sesion = self.sesiones.get(id_sesion)
+        if sesion is None:
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Sesión {partes[0]} no encontrada.")
+
+        if metodo == "GET" and len(partes) == 1:
+            return HTTPStatus.OK, self._respuesta_sesion(id_sesion, sesion), {}
+        if metodo == "POST" and partes[1:] == ["avanzar"]:
+            if not sesion.finalizada:
+                sesion.avanzar()
+                if sesion.finalizada:
+                    async with self._bloqueo_historial:
+                        await asyncio.to_thread(self.controlador.registrar_sesion, sesion.rutina, sesion.socio)
+            return HTTPStatus.OK, self._respuesta_sesion(id_sesion, sesion), {}
+        if metodo == "DELETE" and len(partes) == 1:
+            del self.sesiones[id_sesion]
+            return HTTPStatus.NO_CONTENT, None, {}
+        raise ErrorHTTP(HTTPStatus.NOT_FOUND, "Operación de sesión no encontrada.")
+
+    def _respuesta_sesion(self, id_sesion, sesion):
+        """Serializa el estado de una sesión junto con su id."""
+        datos = sesion.a_diccionario()
+        datos["id"] = id_sesion
+        return RespuestaCacheada.desde_datos(datos)
+
+    def _leer_rutinas(self, partes):
+        """
+        Genera los datos de las rutas de lectura bajo /rutinas.
+        Args:
+            partes (list de str): Segmentos de la ruta después de "rutinas".
+        Returns:
+            dict o list: Datos a serializar.
+        """
+        if not partes:
+            return [
+                {
+                    "id": i,
+                    "nombre": rutina.nombre,
+                    "ejercicios": len(rutina.ejercicios),
+                    "calorias": rutina.estimar_calorias(),
+                }
+                for i, rutina in enumerate(self.controlador.rutinas, 1)
+            ]
+
+        rutina = self._obtener_rutina(partes[0])
+        if len(partes) == 1:
+            return rutina.a_diccionario()
+        if partes[1:] == ["calorias"]:
+            return {
+                "nombre": rutina.nombre,
+                "calorias": rutina.estimar_calorias(),
+                "ejercicios": [
+                    {"nombre_ejercicio": e.nombre_ejercicio, "calorias": e.estimar_calorias()}
+                    for e in rutina.ejercicios
+                ],
+            }
+        if len(partes) == 3 and partes[1] == "ejercicios":
+            indice = self._indice(partes[2])
+            if not 1 <= indice <= len(rutina.ejercicios):
+                raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ejercicio {partes[2]} no encontrado.")
+            return rutina.ejercicios[indice - 1].a_diccionario()
+        raise ErrorHTTP(HTTPStatus.NOT_FOUND, "Ruta no encontrada.")
+
+    def _obtener_rutina(self, valor):
+        """
+        Busca una rutina por su número (empezando en 1, como en la vista CLI).
+        Args:
+            valor (str o int): Número de la rutina.
+        Returns:
+            Rutina: Rutina encontrada.
+        """
+        indice = self._indice(valor)
+        if not 1 <= indice <= len(self.controlador.rutinas):
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Rutina {valor} no encontrada.")
+        return self.controlador.rutinas[indice - 1]
+
+    @staticmethod
+    def _indice(valor):
+        """Convierte un segmento de la ruta en un número entero."""
+        try:
+            return int(valor)
+        except (TypeError, ValueError):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Número inválido: {valor}")
+
+    @staticmethod
+    def _leer_json(cuerpo):
+        """Decodifica el cuerpo JSON de una petición como diccionario."""
+        try:
+            datos = json.loads(cuerpo or b"{}")
+        except ValueError:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "El cuerpo no es un JSON válido.")
+        if not isinstance(datos, dict):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON.")
+        return datos
+
+    @staticmethod
+    def _crear_rutina(datos):
+        """
+        Construye una rutina a partir de los datos recibidos.
+        Cada ejercicio indica su clase en "tipo" y el resto de los campos
+        son los mismos que pide la vista CLI al crearlo.
+        Args:
+            datos (dict): Datos con "nombre" y "ejercicios".
+        Returns:
+            Rutina: Rutina construida.
+        """
+        nombre = datos.get("nombre")
+        if not isinstance(nombre, str) or not nombre.strip():
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "La rutina necesita un nombre.")
+        nombre = nombre.strip()
+        ejercicios = datos.get("ejercicios", [])
+        if not isinstance(ejercicios, list) or not all(isinstance(e, dict) for e in ejercicios):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "\"ejercicios\" debe ser una lista de objetos.")
+
+        rutina = Rutina(nombre)
+        for datos_ejercicio in ejercicios:
+            datos_ejercicio = dict(datos_ejercicio)
+            clase = TIPOS_EJERCICIO.get(datos_ejercicio.pop("tipo", None))
+            if clase is None:
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Tipo de ejercicio inválido.")
+            for campo, valor in datos_ejercicio.items():
+                if campo != "nombre_ejercicio":
+                    datos_ejercicio[campo] = ServidorAPI._validar_numero(campo, valor)
+            nombre_ejercicio = datos_ejercicio.get("nombre_ejercicio")
+            if not isinstance(nombre_ejercicio, str) or not nombre_ejercicio.strip():
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Cada ejercicio necesita un nombre.")
+            try:
+                ejercicio = clase(**datos_ejercicio)
+                calorias = ejercicio.estimar_calorias()
+            except (TypeError, ValueError) as e:
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Datos de ejercicio inválidos: {e}")
+            if not math.isfinite(calorias):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Las calorías estimadas de {nombre_ejercicio} no son finitas.")
+            rutina.agregar_ejercicio(ejercicio)
+        return rutina
+
+    @staticmethod
+    def _validar_numero(campo, valor):
+        """
+        Valida un campo numérico de un ejercicio con las mismas reglas que la vista CLI
+        y dentro de su máximo en MAXIMOS_CAMPOS.
+        Args:
+            campo (str): Nombre del campo.
+            valor: Valor recibido en el JSON.
+        Returns:
+            int o float: Valor validado.
+        """
+        maximo = MAXIMOS_CAMPOS.get(campo)
+        if maximo is None:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Campo desconocido: {campo}")
+        if isinstance(valor, bool) or not isinstance(valor, (int, float)) or not math.isfinite(valor):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"El campo {campo} debe ser un número.")
+        if valor < 0:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"El campo {campo} no puede ser negativo.")
+        if valor > maximo:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"El campo {campo} no puede superar {maximo}.")
+        if campo in CAMPOS_ENTEROS:
+            if valor != int(valor):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"El campo {campo} debe ser un número entero.")
+            return int(valor)
+        return float(valor)
@@ -0,0 +1,81 @@
+import datetime
+import os
+import pickle
+import tempfile
+import unittest
+from controlador.controlador import Controlador
+from modelo.ejercicio_fuerza import EjercicioFuerza
+from modelo.historial import Historial
+from modelo.rutina import Rutina
+from vista.vista_api import VistaAPI
+
+
+class TestCargarHistorial(unittest.TestCase):
+    """Lectura incremental del archivo de historial compartido entre kioscos."""
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.archivo = os.path.join(self.directorio.name, "historial.pkl")
+        self.controlador = self._controlador()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _controlador(self):
+        controlador = Controlador(VistaAPI())
+        controlador.ARCHIVO_HISTORIAL = self.archivo
+        return controlador
+
+    @staticmethod
+    def _lote(socio, sesiones):
+        ejercicio = EjercicioFuerza("Sentadilla", 100, 8, 3, 2)
+        inicio = datetime.date(2026, 9, 1)
+        return [Historial.crear_fila(socio, ejercicio, inicio + datetime.timedelta(days=d)) for d in range(sesiones)]
+
+    def test_lote_incompleto_se_relee_la_proxima_vez(self):
+        self.assertTrue(self.controlador.guardar_historial(self._lote("ana", 2)))
+        segundo = pickle.dumps(self._lote("beto", 3))
+        with open(self.archivo, "ab") as f:
+            f.write(segundo[: len(segundo) // 2])
+
+        self.controlador.cargar_historial()
+        self.assertEqual(self.controlador.historial.socios(), ["ana"])
+        self.assertEqual(len(self.controlador.historial), 2)
+
+        with open(self.archivo, "ab") as f:
+            f.write(segundo[len(segundo) // 2:])
+        self.controlador.cargar_historial()
+        self.assertEqual(self.controlador.historial.socios(), ["ana", "beto"])
+        self.assertEqual(len(self.controlador.historial), 5)
+        self.assertEqual(self.controlador.vista.obtener_mensajes(), [])
+
+    def test_lotes_de_otro_proceso_se_agregan(self):
+        otro = self._controlador()
+        self.controlador.registrar_sesion(_rutina_de(EjercicioFuerza("Press", 60, 10, 3, 1)), "ana")
+        otro.registrar_sesion(_rutina_de(EjercicioFuerza("Remo", 50, 10, 3, 1)), "beto")
+
+        self.controlador.cargar_historial()
+        self.assertEqual(self.controlador.historial.socios(), ["ana", "beto"])
+        self.assertEqual(len(self.controlador.historial), 2)
+
+    def test_archivo_achicado_se_recarga_desde_el_principio(self):
+        self.controlador.guardar_historial(self._lote("ana", 5))
+        self.controlador.guardar_historial(self._lote("ana", 5))
+        self.controlador.cargar_historial()
+        self.assertEqual(len(self.controlador.historial), 10)
+
+        with open(self.archivo, "wb") as f:
+            pickle.dump(self._lote("carla", 1), f)
+        self.controlador.cargar_historial()
+        self.assertEqual(self.controlador.historial.socios(), ["carla"])
+        self.assertEqual(len(self.controlador.historial), 1)
+
+
+def _rutina_de(ejercicio):
+    rutina = Rutina("Prueba")
+    rutina.agregar_ejercicio(ejercicio)
+    return rutina
+
+
+if __name__ == "__main__":
+    unittest.main()
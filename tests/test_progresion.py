@@ -0,0 +1,110 @@
+import datetime
+import unittest
+from modelo.ejercicio_cardio import EjercicioCardio, EjercicioCardioHIIT
+from modelo.ejercicio_fuerza import EjercicioFuerza
+from modelo.historial import Historial
+from modelo.progresion import MotorProgresion
+
+HOY = datetime.date(2026, 10, 20)
+
+
+class TestRecomendar(unittest.TestCase):
+    """Recomendaciones de MotorProgresion para ejercicios de fuerza y HIIT."""
+
+    def setUp(self):
+        self.historial = Historial()
+        self.motor = MotorProgresion(self.historial)
+
+    def _registrar(self, socio, ejercicio, *dias_antes):
+        for dias in dias_antes:
+            self.historial.registrar(socio, ejercicio, HOY - datetime.timedelta(days=dias))
+
+    def _unica(self, socio, fecha=HOY):
+        recomendaciones = self.motor.recomendar(socio, fecha)
+        self.assertEqual(len(recomendaciones), 1)
+        return recomendaciones[0]
+
+    def test_fuerza_progresa_repeticiones_dentro_del_rango(self):
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 8, 3, 2), 10, 3)
+        recomendacion = self._unica("ana")
+        self.assertEqual(recomendacion["estado"], "progresar")
+        self.assertEqual((recomendacion["peso"], recomendacion["repeticiones"]), (100, 9))
+        self.assertEqual(recomendacion["sesiones"], 2)
+        self.assertEqual(recomendacion["volumen_semanal"], 100 * 8 * 3)
+        self.assertIsNone(recomendacion["acwr"])
+        self.assertAlmostEqual(recomendacion["1rm_estimado"], 100 * (1 + 8 / 30))
+
+    def test_fuerza_sube_peso_al_llegar_al_maximo_de_repeticiones(self):
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 12, 3, 2), 10, 3)
+        recomendacion = self._unica("ana")
+        self.assertEqual((recomendacion["peso"], recomendacion["repeticiones"]), (102.5, 6))
+
+    def test_fuerza_descarga_si_la_carga_aguda_supera_la_cronica(self):
+        # La sesión de hace 28 días da historia suficiente pero queda fuera de la ventana crónica:
+        # aguda = 3 sesiones, crónica = 3 sesiones en 4 semanas, ACWR = 4.
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 8, 3, 2), 28, 6, 4, 2)
+        recomendacion = self._unica("ana")
+        self.assertEqual(recomendacion["estado"], "descarga")
+        self.assertAlmostEqual(recomendacion["acwr"], 4.0)
+        self.assertEqual((recomendacion["peso"], recomendacion["repeticiones"]), (90, 8))
+
+    def test_fuerza_mantiene_sin_recuperacion(self):
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 8, 3, 2), 10, 1)
+        recomendacion = self._unica("ana")
+        self.assertEqual(recomendacion["estado"], "mantener")
+        self.assertEqual(recomendacion["dias_desde_ultima"], 1)
+        self.assertIsInstance(recomendacion["dias_desde_ultima"], int)
+        self.assertEqual((recomendacion["peso"], recomendacion["repeticiones"]), (100, 8))
+
+    def test_fuerza_mantiene_si_cae_el_rendimiento(self):
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 8, 3, 2), 10, 6)
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 80, 8, 3, 2), 3)
+        recomendacion = self._unica("ana")
+        self.assertEqual(recomendacion["estado"], "mantener")
+        self.assertEqual((recomendacion["peso"], recomendacion["repeticiones"]), (80, 8))
+
+    def test_hiit_alarga_el_intervalo_hasta_el_objetivo(self):
+        self._registrar("beto", EjercicioCardioHIIT("Cinta", 8, 12, 0.5, 20), 10, 3)
+        recomendacion = self._unica("beto")
+        self.assertEqual(recomendacion["estado"], "progresar")
+        self.assertEqual((recomendacion["velocidad_intensa"], recomendacion["intervalo"]), (12, 0.75))
+        self.assertNotIn("1rm_estimado", recomendacion)
+
+    def test_hiit_sube_la_velocidad_con_el_intervalo_completo(self):
+        self._registrar("beto", EjercicioCardioHIIT("Cinta", 8, 12, 1.0, 20), 10, 3)
+        recomendacion = self._unica("beto")
+        self.assertEqual((recomendacion["velocidad_intensa"], recomendacion["intervalo"]), (12.3, 1.0))
+
+    def test_hiit_descarga_y_mantiene(self):
+        self._registrar("beto", EjercicioCardioHIIT("Cinta", 8, 12, 1.0, 20), 28, 6, 4, 2)
+        recomendacion = self._unica("beto")
+        self.assertEqual(recomendacion["estado"], "descarga")
+        self.assertEqual((recomendacion["velocidad_intensa"], recomendacion["intervalo"]), (10.8, 1.0))
+
+        self._registrar("carla", EjercicioCardioHIIT("Cinta", 8, 12, 1.0, 20), 10, 1)
+        recomendacion = self._unica("carla")
+        self.assertEqual(recomendacion["estado"], "mantener")
+        self.assertEqual((recomendacion["velocidad_intensa"], recomendacion["intervalo"]), (12, 1.0))
+
+    def test_ignora_sesiones_posteriores_a_la_fecha(self):
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 8, 3, 2), 10, 3)
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 150, 8, 3, 2), 0)
+        recomendacion = self._unica("ana", HOY - datetime.timedelta(days=1))
+        self.assertEqual(recomendacion["sesiones"], 2)
+        self.assertEqual(recomendacion["dias_desde_ultima"], 2)
+        self.assertEqual(recomendacion["peso"], 100)
+        self.assertEqual(self.motor.recomendar("ana", HOY - datetime.timedelta(days=20)), [])
+
+    def test_solo_calcula_los_ejercicios_del_socio(self):
+        self._registrar("ana", EjercicioFuerza("Sentadilla", 100, 8, 3, 2), 3)
+        self._registrar("beto", EjercicioCardioHIIT("Cinta", 8, 12, 1.0, 20), 3)
+        self._registrar("beto", EjercicioCardio("Bicicleta", 20, 30), 3)
+        self.assertEqual([r["ejercicio"] for r in self.motor.recomendar("ana", HOY)], ["Sentadilla"])
+        self.assertEqual(self.motor.recomendar("nadie", HOY), [])
+        todos = self.motor.recomendar_todos(HOY)
+        self.assertEqual(sorted(todos), ["ana", "beto"])
+        self.assertEqual([r["ejercicio"] for r in todos["beto"]], ["Cinta"])
+
+
+if __name__ == "__main__":
+    unittest.main()
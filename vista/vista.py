@@ -1,6 +1,7 @@
 import os
 import time
 import sys
+from instrumentacion.metricas import REGISTRO, medido, medido_pantalla, registrar_espera
 from modelo.ejercicio_fuerza import EjercicioFuerza
 from modelo.ejercicio_fuerza import EjercicioFuerzaDropSet
 from modelo.ejercicio_cardio import EjercicioCardio
@@ -9,6 +10,7 @@ from modelo.ejercicio_cardio import EjercicioCardioHIIT
 class VistaCLI:
     """Vista de línea de comandos para la interacción con el usuario."""
 
+    @medido_pantalla("vista.mostrar_menu")
     def mostrar_menu(self):
         """Muestra el menú principal y solicita una opción al usuario.
         Returns:
@@ -19,6 +21,7 @@ class VistaCLI:
         print("1. Seleccionar rutina \n2. Crear rutina\n3. Salir")
         return self.pedir_texto("Seleccione una opción: ")
 
+    @medido_pantalla("vista.pedir_nombre_rutina")
     def pedir_nombre_rutina(self):
         """Solicita al usuario el nombre de una nueva rutina.
         Returns:
@@ -29,6 +32,7 @@ class VistaCLI:
         print("Creando nueva Rutina...")
         return self.pedir_texto("Nombre de la rutina: ")
 
+    @medido_pantalla("vista.seleccionar_tipo_ejercicio")
     def seleccionar_tipo_ejercicio(self, rutina):
         """Solicita al usuario seleccionar el tipo de ejercicio.
         Args:
@@ -47,6 +51,7 @@ class VistaCLI:
             return EjercicioCardio
         return None
 
+    @medido_pantalla("vista.seleccionar_subtipo")
     def seleccionar_subtipo(self, clase_base):
         """Permite al usuario seleccionar un subtipo de ejercicio.
         Args:
@@ -79,7 +84,7 @@ class VistaCLI:
 
         while True:
             try:
-                return float(input(mensaje))
+                return float(self._leer_entrada(mensaje))
             except ValueError:
                 print("Por favor, introduzca un número válido.")
 
@@ -93,7 +98,7 @@ class VistaCLI:
 
         while True:
             try:
-                return int(input(mensaje))
+                return int(self._leer_entrada(mensaje))
             except ValueError:
                 print("Por favor, introduzca un número entero válido.")
 
@@ -105,12 +110,13 @@ class VistaCLI:
             str: Texto introducido.
         """
 
-        valor = input(mensaje).strip()
+        valor = self._leer_entrada(mensaje).strip()
         while not valor:
             print("Este campo no puede estar vacío.")
-            valor = input(mensaje).strip()
+            valor = self._leer_entrada(mensaje).strip()
         return valor
 
+    @medido_pantalla("vista.pedir_datos")
     def pedir_datos(self, clase_modelo):
         """Solicita al usuario los datos necesarios para crear un ejercicio.
         Args:
@@ -157,7 +163,7 @@ class VistaCLI:
             bool: True si desea añadir otro, False en caso contrario.
         """
 
-        otro = input("Ingrese (s) para agregar otro ejercicio u otro carácter para salir: ").strip().lower()
+        otro = self._leer_entrada("Ingrese (s) para agregar otro ejercicio u otro carácter para salir: ").strip().lower()
         return otro == "s"
 
     def mostrar_mensaje(self, mensaje):
@@ -168,6 +174,7 @@ class VistaCLI:
 
         print(mensaje)
 
+    @medido_pantalla("vista.mostrar_rutina")
     def mostrar_rutina(self, rutina):
         """Muestra la rutina completa con sus ejercicios.
         Args:
@@ -183,22 +190,42 @@ class VistaCLI:
     def esperar_confirmacion(self):
         """Pide al usuario que presione una tecla para continuar."""
 
-        input("Presione enter para volver al menú principal...")
+        self._leer_entrada("Presione enter para volver al menú principal...")
 
+    @medido("vista.limpiar_pantalla")
     def limpiar_pantalla(self):
         """Limpia la pantalla de la consola."""
 
         os.system('cls' if os.name == 'nt' else 'clear')
 
+    def _leer_entrada(self, mensaje):
+        """Lee una línea ingresada por el usuario.
+        El tiempo de espera se registra aparte y se descuenta
+        del render de la pantalla en curso.
+        Args:
+            mensaje (str): Mensaje a mostrar.
+        Returns:
+            str: Texto ingresado.
+        """
+
+        if not REGISTRO.activo:
+            return input(mensaje)
+        inicio = time.perf_counter()
+        try:
+            return input(mensaje)
+        finally:
+            registrar_espera("vista.espera_usuario", time.perf_counter() - inicio)
+
     def preguntar_si_desea_cargar_rutina(self):
         """Pregunta si se desea crear una nueva rutina si no hay ninguna.
         Returns:
             bool: True si el usuario responde afirmativamente.
         """
 
-        respuesta = input("No hay rutinas cargadas. ¿Desea crear una nueva? (s/n): ").lower()
+        respuesta = self._leer_entrada("No hay rutinas cargadas. ¿Desea crear una nueva? (s/n): ").lower()
         return respuesta == "s"
 
+    @medido_pantalla("vista.seleccionar_rutina")
     def seleccionar_rutina(self, rutinas):
         """Permite al usuario seleccionar una rutina de la lista.
         Args:
@@ -220,7 +247,7 @@ class VistaCLI:
             print()
 
         try:
-            seleccion = int(input("Selecciona una rutina por número: "))
+            seleccion = int(self._leer_entrada("Selecciona una rutina por número: "))
             if 1 <= seleccion <= len(rutinas):
                 return rutinas[seleccion - 1]
         except ValueError:
@@ -229,6 +256,18 @@ class VistaCLI:
         print("❌ Selección inválida.")
         return None
 
+    @medido_pantalla("vista.pedir_socio")
+    def pedir_socio(self):
+        """Solicita el socio que va a realizar la rutina, para registrarla en su historial.
+        Returns:
+            str o None: Identificador del socio, o None si se deja vacío.
+        """
+
+        self.limpiar_pantalla()
+        socio = self._leer_entrada("Socio que realiza la rutina (Enter para omitir): ").strip()
+        return socio or None
+
+    @medido_pantalla("vista.mostrar_inicio_rutina")
     def mostrar_inicio_rutina(self, nombre_rutina):
         """Informa del inicio de una rutina.
         Args:
@@ -242,8 +281,9 @@ class VistaCLI:
     def esperar_fin_ejercicio(self):
         """Espera que el usuario indique que ha terminado el ejercicio."""
 
-        input("✅ Presiona cualquier tecla cuando termines este ejercicio...")
+        self._leer_entrada("✅ Presiona cualquier tecla cuando termines este ejercicio...")
 
+    @medido_pantalla("vista.mostrar_descanso")
     def mostrar_descanso(self, minutos):
         """Muestra un temporizador de descanso.
         Args:
@@ -254,6 +294,7 @@ class VistaCLI:
         print(f"\n🛌 Descanso de {minutos} minutos")
         self._mostrar_timer_con_barra(segundos)
 
+    @medido_pantalla("vista.temporizador_cardio")
     def _temporizador_cardio(self, ejercicio):
         """Muestra un temporizador para un ejercicio de cardio regular.
         Args:
@@ -265,6 +306,7 @@ class VistaCLI:
         self._mostrar_timer_con_barra(segundos)
         print("\n✅ Ejercicio de cardio regular finalizado.")
 
+    @medido_pantalla("vista.temporizador_cardio_hiit")
     def _temporizador_cardio_hiit(self, ejercicio):
         """Muestra un temporizador para un ejercicio de cardio HIIT.
         Args:
@@ -293,6 +335,7 @@ class VistaCLI:
 
         print("\n✅ Ejercicio HIIT completado.")
 
+    @medido_pantalla("vista.mostrar_fin_rutina")
     def mostrar_fin_rutina(self, nombre_rutina):
         """Informa de que la rutina ha finalizado.
         Args:
@@ -301,21 +344,27 @@ class VistaCLI:
 
         self.limpiar_pantalla()
         print(f"🎉 Rutina '{nombre_rutina}' completada. ¡Bien hecho!\n")
-        input("🔙 Presiona cualquier tecla para volver al menú principal...")
+        self._leer_entrada("🔙 Presiona cualquier tecla para volver al menú principal...")
 
     def _mostrar_timer_con_barra(self, segundos):
         """Muestra una barra de progreso con temporizador.
+        Registra como observación el desvío entre la duración real y la pedida.
         Args:
             segundos (int): Duración total en segundos.
         """
 
         barra_total = 30
+        inicio = time.perf_counter()
         print("⏳", end=" ", flush=True)
         for i in range(barra_total):
             time.sleep(segundos / barra_total)
             print("█", end="", flush=True)
         print("\n")
+        transcurrido = time.perf_counter() - inicio
+        registrar_espera("vista.temporizador", transcurrido)
+        REGISTRO.observar("vista.temporizador.desvio_segundos", transcurrido - segundos)
 
+    @medido_pantalla("vista.mostrar_ejercicio")
     def mostrar_ejercicio(self, ejercicio,nro_set):
         """Muestra la información del ejercicio actual y lanza su temporizador si aplica.
         Args:
@@ -0,0 +1,28 @@
+class VistaAPI:
+    """Vista no bloqueante usada por el servidor HTTP.
+
+    No interactúa con el usuario: solo acumula los mensajes que emite el
+    controlador para que el servidor los incluya en sus respuestas.
+    """
+
+    def __init__(self):
+        """Inicializa la vista con una lista de mensajes vacía."""
+
+        self.mensajes = []
+
+    def mostrar_mensaje(self, mensaje):
+        """Registra un mensaje emitido por el controlador.
+        Args:
+            mensaje (str): Mensaje a registrar.
+        """
+
+        self.mensajes.append(mensaje)
+
+    def obtener_mensajes(self):
+        """Devuelve y descarta los mensajes acumulados.
+        Returns:
+            list de str: Mensajes registrados desde la última consulta.
+        """
+
+        mensajes, self.mensajes = self.mensajes, []
+        return mensajes